@@ -1,6 +1,5 @@
 from rich.console import Console
-from graphical.group import Horizontal, Vertical
-from graphical.heat import Heat
+from graphical.heat import HeatMap
 from graphical.scale.chromatic.sequential import VIRIDIS
 from data import data_heatmap as data
 
@@ -9,20 +8,13 @@ value_range = (
     max(max(d) for d in data),
 )
 
-graph = Vertical()
-for data_line in data:
-    line = Horizontal()
-    for entry in data_line:
-        line.append(
-            Heat(
-                data=entry,
-                value_range=value_range,
-                scheme=VIRIDIS,
-                repeat_x=4,
-                repeat_y=2,
-            )
-        )
-    graph.append(line)
+graph = HeatMap(
+    data,
+    value_range=value_range,
+    scheme=VIRIDIS,
+    repeat_x=4,
+    repeat_y=2,
+)
 
 console = Console()
 console.print(graph)
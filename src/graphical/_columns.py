@@ -0,0 +1,73 @@
+from typing import Any, Iterable, List, Sequence, Tuple
+
+from rich.segment import Segment
+
+from graphical._segment import simplify
+
+Column = Sequence[Segment]
+Lines = Sequence[Sequence[Segment]]
+
+
+class ColumnBuffer:
+    """Collects columns of one cell segments and transposes them into rows.
+
+    Vertical renderables provide their cells column by column, top to bottom.
+    Writing them into a buffer avoids rendering each of them into lines first.
+    Rendered lines of other renderables and gaps can be written in between.
+    """
+
+    _COLUMN = 0
+    _LINES = 1
+    _GAP = 2
+
+    def __init__(self) -> None:
+        self._entries: List[Tuple[int, Any]] = []
+
+    def write(self, column: Column, width: int = 1) -> None:
+        """Add a column of one cell segments, top to bottom.
+
+        Args:
+            column (Sequence[Segment]): Segments of the column.
+            width (int, optional): Number of times the column is repeated. Defaults to 1.
+        """
+        self._entries += [(self._COLUMN, column)] * width
+
+    def write_columns(self, columns: Iterable[Column]) -> None:
+        """Add multiple columns of one cell segments, left to right."""
+        self._entries += [(self._COLUMN, column) for column in columns]
+
+    def write_lines(self, lines: Lines) -> None:
+        """Add already rendered lines, top to bottom."""
+        self._entries.append((self._LINES, lines))
+
+    def write_gap(self, width: int) -> None:
+        """Add a gap of given width that spans all rows."""
+        if width > 0:
+            self._entries.append((self._GAP, Segment(" " * width)))
+
+    @property
+    def height(self) -> int:
+        """Number of rows in the buffer."""
+        heights = [len(d) for kind, d in self._entries if kind != self._GAP]
+        return max(heights, default=0)
+
+    def rows(self) -> Iterable[List[Segment]]:
+        """Transpose the buffer into rows.
+
+        Yields:
+            List[Segment]: Simplified segments of the next row.
+        """
+        column, lines = self._COLUMN, self._LINES
+        entries = self._entries
+        for row_idx in range(self.height):
+            row: List[Segment] = []
+            for kind, entry in entries:
+                if kind == column:
+                    if row_idx < len(entry):
+                        row.append(entry[row_idx])
+                elif kind == lines:
+                    if row_idx < len(entry):
+                        row += entry[row_idx]
+                else:
+                    row.append(entry)
+            yield list(simplify(row))
@@ -0,0 +1,83 @@
+"""Measurement cache shared by the renderables of one render.
+
+Rich measures renderables again at each nesting level. Groups measure their
+children through ``measure`` inside a ``render_scope``, so each renderable is
+measured once per maximum width and render. A render is the outermost call
+of the console, such as ``Console.print``. Rich measures and renders in
+separate passes, for example a ``Table`` measures its cells before it renders
+them, so cached measurements are kept until the console call ends rather
+than until the outermost scope ends. Outside of a console call, they are
+kept until the outermost scope ends.
+"""
+
+import sys
+import threading
+from contextlib import contextmanager
+from types import FrameType
+from typing import Dict, Iterator, Optional, Tuple
+
+from rich.console import Console, ConsoleOptions, RenderableType
+from rich.measure import Measurement
+
+
+class _Scope(threading.local):
+    def __init__(self) -> None:
+        self.depth = 0
+        # Renderables are kept alive, so their ids are not reused within a scope
+        self.measurements: Dict[
+            Tuple[int, int], Tuple[RenderableType, Measurement]
+        ] = {}
+        # Frame of the console call the measurements belong to, kept alive so
+        # that the frame of another call cannot be identical
+        self.call: Optional[FrameType] = None
+
+
+_scope = _Scope()
+
+
+def _console_call() -> Optional[FrameType]:
+    """Get the frame of the outermost console method on the stack, if any."""
+    call = None
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame is not None:
+        if frame.f_globals.get("__name__") == "rich.console":
+            call = frame
+        frame = frame.f_back
+    return call
+
+
+@contextmanager
+def render_scope() -> Iterator[None]:
+    """Share cached measurements until the console call or outermost scope ends."""
+    if not _scope.depth:
+        call = _console_call()
+        if call is None or call is not _scope.call:
+            _scope.measurements.clear()
+        _scope.call = call
+    _scope.depth += 1
+    try:
+        yield
+    finally:
+        _scope.depth -= 1
+        if not _scope.depth and _scope.call is None:
+            _scope.measurements.clear()
+
+
+def invalidate() -> None:
+    """Drop cached measurements of the current scope."""
+    _scope.measurements.clear()
+
+
+def measure(
+    console: Console, options: ConsoleOptions, renderable: RenderableType
+) -> Measurement:
+    """Get the measurement of a renderable, cached by identity and maximum width within a render scope."""
+    if not _scope.depth:
+        return Measurement.get(console, options, renderable)
+    key = (id(renderable), options.max_width)
+    cached = _scope.measurements.get(key)
+    if cached is None:
+        measurement = Measurement.get(console, options, renderable)
+        _scope.measurements[key] = (renderable, measurement)
+        return measurement
+    return cached[1]
@@ -0,0 +1,17 @@
+"""Optional NumPy support.
+
+NumPy is not a requirement of graphical. Batch functions use it when it is
+installed and fall back to pure Python otherwise.
+"""
+
+from typing import Any
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore[assignment]
+
+
+def is_array(data: Any) -> bool:
+    """Returns if data is a NumPy array."""
+    return numpy is not None and isinstance(data, numpy.ndarray)
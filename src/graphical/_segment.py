@@ -0,0 +1,26 @@
+from typing import Iterable, Iterator
+
+from rich.segment import Segment
+
+
+def simplify(segments: Iterable[Segment]) -> Iterator[Segment]:
+    """Combine contiguous segments with the same style, same as ``Segment.simplify``.
+
+    Cells of a row mostly share the same style objects. Styles are compared by
+    identity first and texts of a run are joined once.
+    """
+    iter_segments = iter(segments)
+    last = next(iter_segments, None)
+    if last is None:
+        return
+    style = last.style
+    texts = [last.text]
+    for segment in iter_segments:
+        if (segment.style is style or segment.style == style) and not segment.control:
+            texts.append(segment.text)
+        else:
+            yield Segment("".join(texts), style) if len(texts) > 1 else last
+            last = segment
+            style = segment.style
+            texts = [segment.text]
+    yield Segment("".join(texts), style) if len(texts) > 1 else last
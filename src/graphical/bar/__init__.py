@@ -1,4 +1,5 @@
 from ._bar import Bar
+from ._chart import BarChart
 from ._range import Range
 from ._stack import Stack
 from ._range_stack import RangeStack
@@ -9,4 +10,6 @@ __all__ = [
     "Range",
     "Stack",
     "RangeStack",
+    # Charts
+    "BarChart",
 ]
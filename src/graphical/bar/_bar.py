@@ -1,27 +1,30 @@
-from typing import Iterable, Tuple, Optional, Union
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Tuple, Optional, Union
 
 from rich.color import Color
 from rich.console import ConsoleOptions, Console, RenderResult
 from rich.segment import Segment, Segments
 from rich.measure import Measurement
-from rich.style import Style
 
+from graphical._segment import simplify
 from graphical.mark import Mark
 from graphical.mark.horizontal import BAR_BLOCK_H
 from graphical.mark.vertical import BAR_BLOCK_V
+from graphical.observe import Observable, Observed
 from graphical.options import OptimizationStrategy, Orientation, InversionStrategy
+from graphical.scale import Grid, Scale, ValueRange, as_scale
 from graphical.section import Section
+from graphical.style import STYLES, StyleSet
 
-from ._invert_style import invert_style
 from ._overlap import overlap
 
 
-class Bar:
+class Bar(Observable):
     """Bar graph.
 
     Args:
         data (float): The value.
-        value_range (Tuple[float, float]): Lower and upper boundary.
+        value_range (Union[Tuple[float, float], Scale]): Lower and upper boundary, or scale.
         length (int): The length of the graph. Defaults to 100.
         width (int): The width of the bars. Defaults to 1.
         marks (Union[BarMark, Mark]], optional): Marks used for the bar. Defaults to "block".
@@ -34,10 +37,12 @@ class Bar:
         prefer_bg (OptimizationStrategy): Replace block characters with background, either "never", for "full" blocks only, or for all. Defaults to "full".
     """
 
+    value = Observed()
+
     def __init__(
         self,
         data: float,
-        value_range: Tuple[float, float],
+        value_range: ValueRange,
         *,
         length: Optional[int] = None,
         width: Optional[int] = None,
@@ -85,63 +90,129 @@ class Bar:
         """
         length = length or self.length
         vertical = self.orientation == "vertical"
-        style = Style(color=self.color, bgcolor=self.bgcolor)
+        styles = STYLES.styles(self.color, self.bgcolor, self.invert_negative)
         bar = Section(min(self.origin, self.value), max(self.origin, self.value))
 
-        lower, upper = self.value_range
-        step = abs(upper - lower) / length
-        inset = max(int((bar.lower - lower) // step), 0)
-        trail = max(int((upper - bar.upper) // step), 0)
-        length = length - (inset + trail)
+        scale = as_scale(self.value_range)
+        inset, trail = scale.span(bar.lower, bar.upper, length)
 
         # Handle Whitespace
-        base_style = Style(bgcolor=self.bgcolor)
+        base_style = styles.background
         for _ in range(trail if vertical else inset):
             yield Segment(" ", style=base_style)
 
-        segments = Section(lower + inset * step, upper - trail * step).segment(length)
-        if vertical:
-            segments = list(segments)[::-1]
-        for segment in segments:
-            cell_value = overlap(bar, segment, force_origin=self.force_origin)
-            if self.prefer_bg == "full" and self.marks.get(cell_value) == "█":
-                # Replace full blocks with background
-                yield Segment(" ", style=invert_style(style))
-                continue
-            if self.prefer_bg == "all" and self.marks.invertible:
-                # Replace all blocks with background
-                _style = invert_style(style) if abs(cell_value) >= 0.5 else style
-                yield Segment(" ", style=_style)
-                continue
-            invert = cell_value < 0 and self._invertible()
-            invert_mark = invert and self.invert_negative is not None
-            cell_style = invert_style(style, self.invert_negative) if invert else style
-            if self.value in segment and self.value != segment.lower:
-                # Use cap character for the upper boundary of the bar
-                cell_char = self.marks.cap(cell_value, invert_mark)
-            else:
-                cell_char = self.marks.get(cell_value, invert_mark)
-            yield Segment(cell_char, style=cell_style)
+        grid = scale.grid(length)
+        cells = self._cells(bar, scale, grid, inset, length - trail, styles)
+        yield from (cells[::-1] if vertical else cells)
 
         # Handle whitespace
         for _ in range(inset if vertical else trail):
             yield Segment(" ", style=base_style)
 
+    def _cells(
+        self,
+        bar: Section,
+        scale: Scale,
+        grid: Grid,
+        start: int,
+        end: int,
+        styles: StyleSet,
+    ) -> List[Segment]:
+        """Computes the cells between two boundaries of the grid in closed form.
+
+        Only the cells at the boundaries of the bar can be partially filled, all
+        other cells are either empty or full and share the same segment.
+
+        Args:
+            bar (Section): Value range of the bar.
+            scale (Scale): Scale of the grid.
+            grid (Grid): Cell boundaries of the scale.
+            start (int): Index of the lower boundary of the first cell.
+            end (int): Index of the upper boundary of the last cell.
+            styles (StyleSet): Styles of the bar.
+
+        Returns:
+            List[Segment]: One segment per cell in ascending order.
+        """
+        count = end - start
+        if count <= 0:
+            return []
+        boundaries, positions = grid
+        # Indices of the first and last cell boundary inside the bar
+        first = bisect_left(boundaries, bar.lower, start, end + 1) - start
+        last = bisect_right(boundaries, bar.upper, start, end + 1) - 1 - start
+
+        cells = [self._cell(0.0, styles)] * count
+        if last - 1 > first:
+            full = self._cell(-1.0 if bar.lower < 0.0 else 1.0, styles)
+            cells[first : last - 1] = [full] * (last - 1 - first)
+        partial = sorted({first - 1, last - 1, last} & set(range(count)))
+        if partial:
+            # Overlaps are measured in positions on the scale
+            transform = scale.transform
+            position = Section(transform(bar.lower), transform(bar.upper))
+            origin = transform(0.0)
+        for idx in partial:
+            lower, upper = start + idx, start + idx + 1
+            cell = Section(positions[lower], positions[upper])
+            cell_value = overlap(
+                position, cell, origin=origin, force_origin=self.force_origin
+            )
+            cap = boundaries[lower] <= self.value <= boundaries[upper]
+            cap = cap and self.value != boundaries[lower]
+            cells[idx] = self._cell(cell_value, styles, cap)
+        return cells
+
+    def _cell(self, value: float, styles: StyleSet, cap: bool = False) -> Segment:
+        marks = self.marks
+        if self.prefer_bg == "full" and marks.is_full(marks.level(value)):
+            # Replace full blocks with background
+            return Segment(" ", style=styles.swapped)
+        if self.prefer_bg == "all" and marks.invertible:
+            # Replace all blocks with background
+            style = styles.swapped if abs(value) >= 0.5 else styles.normal
+            return Segment(" ", style=style)
+        invert = value < 0 and self._invertible()
+        invert_mark = invert and self.invert_negative is not None
+        cell_style = styles.inverted if invert else styles.normal
+        if cap:
+            # Use cap character for the upper boundary of the bar
+            return Segment(marks.cap(value, invert_mark), style=cell_style)
+        return Segment(marks.glyph(marks.level(value, invert_mark)), style=cell_style)
+
     def __graphical_group__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
         if self.orientation in "horizontal":
             length = min(self.length, options.max_width)
-            yield Segments(Segment.simplify(self.segments(length)))
+            yield Segments(simplify(self.segments(length)))
             if self.width > 1:
                 yield Segments(
-                    [Segment.line(), *Segment.simplify(self.segments(length))]
+                    [Segment.line(), *simplify(self.segments(length))]
                     * (self.width - 1)
                 )
         else:
             for segment in self.segments():
                 yield Segments([segment] * self.width)
 
+    def __graphical_size__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Optional[Tuple[int, int]]:
+        if self.orientation in "horizontal":
+            return min(self.length, options.max_width), self.width
+        return self.width, self.length
+
+    def __graphical_new_line__(self) -> bool:
+        return self.orientation not in "horizontal"
+
+    def __graphical_columns__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Optional[List[List[Segment]]]:
+        if self.orientation in "horizontal":
+            length = min(self.length, options.max_width)
+            return [[cell] * self.width for cell in self.segments(length)]
+        return [list(self.segments())] * self.width
+
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
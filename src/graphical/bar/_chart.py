@@ -0,0 +1,159 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+from rich.color import Color
+from rich.console import ConsoleOptions, Console, RenderResult
+from rich.segment import Segment
+from rich.measure import Measurement
+
+from graphical.mark import Mark
+from graphical.observe import Observable, Observed
+from graphical.options import OptimizationStrategy, Orientation, InversionStrategy
+from graphical.scale import ValueRange
+
+from graphical._columns import ColumnBuffer
+from graphical._segment import simplify
+
+from ._bar import Bar
+
+ColorType = Union[Color, str]
+
+
+def _cycle(
+    colors: Optional[Union[ColorType, Sequence[ColorType]]], idx: int
+) -> Optional[ColorType]:
+    if colors is None or isinstance(colors, (str, Color)):
+        return colors
+    return colors[idx % len(colors)]
+
+
+class BarChart(Observable):
+    """Bar chart of a series of values sharing one value range.
+
+    Renders all bars in one pass, instead of arranging one ``Bar`` per value in a group.
+
+    Args:
+        data (Sequence[float]): The values.
+        value_range (Union[Tuple[float, float], Scale]): Lower and upper boundary, or scale.
+        length (int): The length of the bars. Defaults to 25.
+        width (int): The width of the bars. Defaults to 1.
+        gap (int): Gap between bars. Defaults to 0.
+        marks (Union[BarMark, Mark]], optional): Marks used for the bars. Defaults to "block".
+        color (Union[Color, str, Sequence[Union[Color, str]]], optional): Color of the bars, cycled if a sequence. Defaults to "default".
+        bgcolor (Union[Color, str, Sequence[Union[Color, str]]], optional): Background color, cycled if a sequence. Defaults to "default".
+        invert_negative (Literal["reverse",  "swap"], optional): Use positive marks and invert cell colors for negative number. If None or not supported by marks, the cell is not inverted.
+        orientation: (Literal["horizontal", "vertical"], optional): The orientation of the bars. Defaults to "horizontal".
+        origin (float, optional): Origin point. Defaults to 0.0.
+        force_origin (bool, optional): Force origin to half cell grid. Defaults to False.
+        prefer_bg (OptimizationStrategy): Replace block characters with background, either "never", for "full" blocks only, or for all. Defaults to "full".
+    """
+
+    values = Observed()
+
+    def __init__(
+        self,
+        data: Sequence[float],
+        value_range: ValueRange,
+        *,
+        length: Optional[int] = None,
+        width: Optional[int] = None,
+        gap: int = 0,
+        marks: Optional[Mark] = None,
+        color: Optional[Union[ColorType, Sequence[ColorType]]] = None,
+        bgcolor: Optional[Union[ColorType, Sequence[ColorType]]] = None,
+        invert_negative: Optional[InversionStrategy] = None,
+        orientation: Orientation = "horizontal",
+        origin: Optional[float] = None,
+        force_origin: Optional[bool] = None,
+        prefer_bg: Optional[OptimizationStrategy] = None,
+    ) -> None:
+        self.values = data
+        self.value_range = value_range
+        self.length = length or 25
+        self.width = width or 1
+        self.gap = gap
+        self.marks = marks
+        self.color = color
+        self.bgcolor = bgcolor
+        self.invert_negative: Optional[InversionStrategy] = invert_negative
+        self.orientation = orientation
+        self.origin = origin
+        self.force_origin = force_origin
+        self.prefer_bg = prefer_bg
+
+    def bars(self, length: Optional[int] = None) -> Iterable[List[Segment]]:
+        """Returns the rendered segments of each bar.
+
+        Bars with the same value and colors are only rendered once.
+
+        Args:
+            length (Optional[int], optional): Override bar graph length.
+        Yields:
+            List[Segment]: Segments of the next bar, one per cell.
+        """
+        length = length or self.length
+        bar = Bar(
+            0.0,
+            self.value_range,
+            length=length,
+            marks=self.marks,
+            invert_negative=self.invert_negative,
+            orientation=self.orientation,
+            origin=self.origin,
+            force_origin=self.force_origin,
+            prefer_bg=self.prefer_bg,
+        )
+        cache: Dict[tuple, List[Segment]] = {}
+        for idx, value in enumerate(self.values):
+            color = _cycle(self.color, idx)
+            bgcolor = _cycle(self.bgcolor, idx)
+            key = (value, color, bgcolor)
+            if key not in cache:
+                bar.value = value
+                bar.color = color
+                bar.bgcolor = bgcolor
+                cache[key] = list(bar.segments(length))
+            yield cache[key]
+
+    def __graphical_columns__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Optional[List[List[Segment]]]:
+        if self.orientation != "vertical":
+            return None
+        columns: List[List[Segment]] = []
+        gap = [Segment(" ")] * self.length
+        for idx, bar in enumerate(self.bars()):
+            if idx > 0:
+                columns += [gap] * self.gap
+            columns += [bar] * self.width
+        return columns
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        new_line = Segment.line()
+        if self.orientation in "horizontal":
+            length = min(self.length, options.max_width)
+            for idx, bar in enumerate(self.bars(length)):
+                if idx > 0 and self.gap > 0:
+                    yield from [new_line] * self.gap
+                line = list(simplify(bar))
+                for _ in range(self.width):
+                    yield from line
+                    yield new_line
+        else:
+            buffer = ColumnBuffer()
+            buffer.write_columns(self.__graphical_columns__(console, options) or [])
+            for row_idx, row in enumerate(buffer.rows()):
+                if row_idx > 0:
+                    yield new_line
+                yield from row
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        if self.orientation in "horizontal":
+            return Measurement(5, self.length)
+        else:
+            count = len(self.values)
+            width = count * self.width + max(count - 1, 0) * self.gap
+            return Measurement(width, width)
@@ -4,6 +4,7 @@ from rich.color import Color
 
 from graphical.mark import Mark
 from graphical.options import Orientation, InversionStrategy
+from graphical.scale import ValueRange
 
 from ._bar import Bar
 
@@ -13,7 +14,7 @@ class Range(Bar):
 
     Args:
         data (Tuple[float, float]): Start and end point of range.
-        value_range: Lower and upper boundary.
+        value_range (Union[Tuple[float, float], Scale]): Lower and upper boundary, or scale.
         length (int): The length of the graph. Defaults to 100.
         width (int): The width of the bars. Defaults to 1.
         marks (Union[BarMark, Mark]], optional): Marks used for the bar. Defaults to "block".
@@ -26,7 +27,7 @@ class Range(Bar):
     def __init__(
         self,
         data: Tuple[float, float],
-        value_range: Tuple[float, float],
+        value_range: ValueRange,
         *,
         length: Optional[int] = None,
         width: Optional[int] = None,
@@ -1,9 +1,10 @@
-from typing import Optional, Sequence, Tuple, Union
+from typing import Optional, Sequence, Union
 
 from rich.color import Color
 
 from graphical.mark import Mark
 from graphical.options import Orientation, InversionStrategy
+from graphical.scale import ValueRange
 
 from ._stack import Stack
 
@@ -13,7 +14,7 @@ class RangeStack(Stack):
 
     Args:
         data (Sequence[float]): The values in order of stacking. The first value is the stack offset.
-        value_range: Lower and upper boundary. Defaults to range of data.
+        value_range (Union[Tuple[float, float], Scale]): Lower and upper boundary, or scale.
         length (int): The length of the graph. Defaults to 100.
         width (int): The width of the bars. Defaults to 1.
         marks (Union[BarMark, Mark]], optional): Marks used for the bars. Defaults to "block".
@@ -26,7 +27,7 @@ class RangeStack(Stack):
     def __init__(
         self,
         data: Sequence[float],
-        value_range: Tuple[float, float],
+        value_range: ValueRange,
         *,
         length: Optional[int] = None,
         width: Optional[int] = None,
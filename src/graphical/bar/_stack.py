@@ -1,4 +1,4 @@
-from typing import Iterable, Sequence, Tuple, Optional, Union
+from typing import Iterable, List, Sequence, Tuple, Optional, Union
 
 from rich.color import Color
 from rich.console import ConsoleOptions, Console, RenderResult
@@ -6,23 +6,26 @@ from rich.segment import Segment, Segments
 from rich.measure import Measurement
 from rich.style import Style
 
+from graphical._segment import simplify
 from graphical.mark import Mark
 from graphical.mark.horizontal import BAR_BLOCK_H
 from graphical.mark.vertical import BAR_BLOCK_V
+from graphical.observe import Observable, Observed
 from graphical.options import OptimizationStrategy, Orientation, InversionStrategy
 from graphical.section import Section
+from graphical.scale import ValueRange, as_scale
 from graphical.scale.chromatic.ordinal import CATEGORY10
+from graphical.style import STYLES
 
-from ._invert_style import invert_style
 from ._overlap import overlap
 
 
-class Stack:
+class Stack(Observable):
     """Stacked bar graph.
 
     Args:
         data (Sequence[float]): The values in order of stacking.
-        value_range: Lower and upper boundary. Defaults to range of data.
+        value_range (Union[Tuple[float, float], Scale]): Lower and upper boundary, or scale.
         length (int): The length of the graph. Defaults to 100.
         width (int): The width of the bars. Defaults to 1.
         marks (Union[BarMark, Mark]], optional): Marks used for the bars. Defaults to "block".
@@ -35,10 +38,12 @@ class Stack:
         prefer_bg (OptimizationStrategy): Replace block characters with background, either "never", for "full" blocks only, or for all. Defaults to "full".
     """
 
+    values = Observed()
+
     def __init__(
         self,
         data: Sequence[float],
-        value_range: Tuple[float, float],
+        value_range: ValueRange,
         *,
         length: Optional[int] = None,
         width: Optional[int] = None,
@@ -67,13 +72,12 @@ class Stack:
         self.prefer_bg = prefer_bg or "full"
 
     def _stacked_colors(self) -> Sequence[Color]:
-        colors = []
+        pos = []
+        neg = []
         for idx, value in enumerate(self.values):
-            if value >= 0.0:
-                colors.append(self.colors[idx % len(self.colors)])
-            else:
-                colors.insert(0, self.colors[idx % len(self.colors)])
-        return colors
+            stack = pos if value >= 0.0 else neg
+            stack.append(self.colors[idx % len(self.colors)])
+        return neg[::-1] + pos
 
     def _stacked_values(self) -> Sequence[float]:
         pos = []
@@ -98,12 +102,12 @@ class Stack:
             return False
 
     def _optimize_bg(self, value: float, style: Style) -> Optional[Segment]:
-        if self.prefer_bg == "full" and self.marks.get(value) == "█":
+        if self.prefer_bg == "full" and self.marks.is_full(self.marks.level(value)):
             # Replace full blocks with background
-            return Segment(" ", style=invert_style(style))
+            return Segment(" ", style=STYLES.invert(style))
         if self.prefer_bg == "all" and self.marks.invertible:
             # Replace all blocks with background
-            style = invert_style(style) if abs(value) >= 0.5 else style
+            style = STYLES.invert(style) if abs(value) >= 0.5 else style
             return Segment(" ", style=style)
         return None
 
@@ -122,113 +126,142 @@ class Stack:
         bounds = self._stacked_values()
         bars = self._stacked_bars(bounds)
 
-        lower, upper = self.value_range
-        bar_lower = bounds[0]
-        bar_upper = bounds[-1]
-        step = abs(upper - lower) / length
-        inset = max(int((bar_lower - lower) // step), 0)
-        trail = max(int((upper - bar_upper) // step), 0)
-        length = length - (inset + trail)
+        scale = as_scale(self.value_range)
+        inset, trail = scale.span(bounds[0], bounds[-1], length)
 
         # Handle Whitespace
-        base_style = Style(bgcolor=self.bgcolor)
+        base_style = STYLES.get(bgcolor=self.bgcolor)
         for _ in range(trail if vertical else inset):
             yield Segment(" ", style=base_style)
 
-        # Handle Segments that overlap with bars
-        segments = Section(lower + inset * step, upper - trail * step).segment(length)
-        if vertical:
-            segments = list(segments)[::-1]
-        for segment in segments:
+        # Overlaps are measured in positions on the scale
+        transform = scale.transform
+        bars = [Section(transform(d.lower), transform(d.upper)) for d in bars]
+        origin = transform(self.origin)
+        end = max(length - trail, inset)
+        positions = scale.grid(length).positions[inset : end + 1]
+
+        # Sweep cells and bars in ascending order, both sorted by their bounds
+        cells = []
+        first = 0
+        for lower, upper in zip(positions[:-1], positions[1:]):
+            segment = Section(lower, upper)
+            # Bars ending below this cell end below all following cells
+            while first < len(bars) and bars[first].upper < segment.lower:
+                first += 1
             cell_ids = []
             cell_values = []
-            for idx, bar in enumerate(bars):
-                if not bar.overlaps(segment):
-                    continue
+            idx = first
+            while idx < len(bars) and bars[idx].lower <= segment.upper:
                 cell_value = overlap(
-                    bar,
+                    bars[idx],
                     segment,
-                    origin=self.origin,
+                    origin=origin,
                     force_origin=self.force_origin,
                 )
-                if cell_value == 0.0:
-                    continue
-                cell_ids.append(idx)
-                cell_values.append(cell_value)
-            # No bar in segment
-            if not cell_ids:
-                yield Segment(" ", style=base_style)
-            # One bar in segment
-            elif len(cell_ids) == 1:
-                cell_value = cell_values[0]
-                cell_color = colors[cell_ids[0] % len(colors)]
-                cell_style = Style(color=cell_color, bgcolor=self.bgcolor)
-                # Check if background optimization can be applied
-                optimized = self._optimize_bg(cell_value, cell_style)
-                if optimized:
-                    yield optimized
-                    continue
-                invert = cell_value < 0 and self._invertible(cell_color)
-                invert_mark = invert and self.invert_negative is not None
-                if invert:
-                    cell_style = invert_style(cell_style, self.invert_negative)
-                yield Segment(self.marks.get(cell_value, invert_mark), style=cell_style)
-            # Multiple bars in segment
-            else:
-                # Use the two largest sections in order
-                id_values = sorted(zip(cell_ids, cell_values), key=lambda x: x[1])
-                trailing, leading = sorted(id_values[-2:], key=lambda x: x[0])
-                trailing_id, trailing_val = trailing
-                trailing_color = colors[trailing_id % len(colors)]
-                leading_id, leading_val = leading
-                leading_color = colors[leading_id % len(colors)]
-                # Check if background optimization strategy can be applied
-                relative_val = abs(trailing_val) / (
-                    abs(leading_val) + abs(trailing_val)
-                )
-                default_style = Style(color=trailing_color, bgcolor=leading_color)
-                optimized = self._optimize_bg(relative_val, default_style)
-                if optimized:
-                    # Use background instead
-                    yield optimized
-                elif self.marks.invertible:
-                    # Always use the trailing bar fragment for better resolution
-                    yield Segment(
-                        self.marks.get(trailing_val),
-                        style=Style(color=trailing_color, bgcolor=leading_color),
-                    )
-                else:
-                    # Use bar with more overlap to fill whole segment
-                    if abs(trailing_val) > abs(leading_val):
-                        cell_char = self.marks.get(1.0)
-                        color = trailing_color
-                    else:
-                        cell_char = self.marks.get(-1.0)
-                        color = leading_color
-                    yield Segment(
-                        cell_char,
-                        style=Style(color=color, bgcolor=self.bgcolor),
-                    )
+                if cell_value != 0.0:
+                    cell_ids.append(idx)
+                    cell_values.append(cell_value)
+                idx += 1
+            cells.append(self._cell(cell_ids, cell_values, colors, base_style))
+        yield from (cells[::-1] if vertical else cells)
 
         # Handle whitespace
         for _ in range(inset if vertical else trail):
             yield Segment(" ", style=base_style)
 
+    def _cell(
+        self,
+        cell_ids: Sequence[int],
+        cell_values: Sequence[float],
+        colors: Sequence[Union[Color, str]],
+        base_style: Style,
+    ) -> Segment:
+        # No bar in segment
+        if not cell_ids:
+            return Segment(" ", style=base_style)
+        # One bar in segment
+        if len(cell_ids) == 1:
+            cell_value = cell_values[0]
+            cell_color = colors[cell_ids[0] % len(colors)]
+            styles = STYLES.styles(cell_color, self.bgcolor, self.invert_negative)
+            # Check if background optimization can be applied
+            optimized = self._optimize_bg(cell_value, styles.normal)
+            if optimized:
+                return optimized
+            invert = cell_value < 0 and self._invertible(cell_color)
+            invert_mark = invert and self.invert_negative is not None
+            cell_style = styles.inverted if invert else styles.normal
+            cell_char = self.marks.glyph(self.marks.level(cell_value, invert_mark))
+            return Segment(cell_char, style=cell_style)
+        # Multiple bars in segment: Use the two largest sections in order,
+        # later bars win ties
+        largest = second = None
+        for entry in zip(cell_ids, cell_values):
+            if largest is None or entry[1] >= largest[1]:
+                largest, second = entry, largest
+            elif second is None or entry[1] >= second[1]:
+                second = entry
+        trailing, leading = sorted((second, largest), key=lambda x: x[0])
+        trailing_id, trailing_val = trailing
+        trailing_color = colors[trailing_id % len(colors)]
+        leading_id, leading_val = leading
+        leading_color = colors[leading_id % len(colors)]
+        # Check if background optimization strategy can be applied
+        relative_val = abs(trailing_val) / (abs(leading_val) + abs(trailing_val))
+        default_style = STYLES.get(trailing_color, leading_color)
+        optimized = self._optimize_bg(relative_val, default_style)
+        if optimized:
+            # Use background instead
+            return optimized
+        if self.marks.invertible:
+            # Always use the trailing bar fragment for better resolution
+            return Segment(
+                self.marks.glyph(self.marks.level(trailing_val)),
+                style=default_style,
+            )
+        # Use bar with more overlap to fill whole segment
+        if abs(trailing_val) > abs(leading_val):
+            cell_char = self.marks.get(1.0)
+            color = trailing_color
+        else:
+            cell_char = self.marks.get(-1.0)
+            color = leading_color
+        return Segment(cell_char, style=STYLES.get(color, self.bgcolor))
+
     def __graphical_group__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
         if self.orientation in "horizontal":
             length = min(self.length, options.max_width)
-            yield Segments(Segment.simplify(self.segments(length)))
+            yield Segments(simplify(self.segments(length)))
             if self.width > 1:
                 yield Segments(
-                    [Segment.line(), *Segment.simplify(self.segments(length))]
+                    [Segment.line(), *simplify(self.segments(length))]
                     * (self.width - 1)
                 )
         else:
             for segment in self.segments():
                 yield Segments([segment] * self.width)
 
+    def __graphical_size__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Optional[Tuple[int, int]]:
+        if self.orientation in "horizontal":
+            return min(self.length, options.max_width), self.width
+        return self.width, self.length
+
+    def __graphical_new_line__(self) -> bool:
+        return self.orientation not in "horizontal"
+
+    def __graphical_columns__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Optional[List[List[Segment]]]:
+        if self.orientation in "horizontal":
+            length = min(self.length, options.max_width)
+            return [[cell] * self.width for cell in self.segments(length)]
+        return [list(self.segments())] * self.width
+
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
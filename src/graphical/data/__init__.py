@@ -1,12 +1,17 @@
-from ._bins import bins, SummaryFunction
+from ._bins import bins, SummaryFunction, SummaryKernel
 from ._bands import bands
+from ._decimate import lttb, m4, minmax
 from ._normalize import normalize
 from ._pairs import pairs
 
 __all__ = [
     "bins",
     "bands",
+    "lttb",
+    "m4",
+    "minmax",
     "normalize",
     "pairs",
     "SummaryFunction",
+    "SummaryKernel",
 ]
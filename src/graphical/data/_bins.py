@@ -1,32 +1,175 @@
-from statistics import mean
-from typing import Callable, Generator, Sequence
+import statistics
+from collections import deque
+from itertools import islice
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Literal,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from graphical import _numpy
 
 SummaryFunction = Callable[[Sequence[float]], float]
+SummaryKernel = Literal[
+    "mean",
+    "sum",
+    "min",
+    "max",
+    "count",
+    "first",
+    "last",
+    "median",
+]
+
+_NAN = float("nan")
+
+
+def _drain(values: Iterator[float]) -> None:
+    deque(values, maxlen=0)
+
+
+def _mean(values: Iterator[float], count: int) -> float:
+    return sum(values) / count if count else _NAN
+
+
+def _sum(values: Iterator[float], count: int) -> float:
+    return sum(values)
+
+
+def _min(values: Iterator[float], count: int) -> float:
+    return min(values, default=_NAN)
+
+
+def _max(values: Iterator[float], count: int) -> float:
+    return max(values, default=_NAN)
+
+
+def _count(values: Iterator[float], count: int) -> float:
+    _drain(values)
+    return count
+
+
+def _first(values: Iterator[float], count: int) -> float:
+    first = next(values, _NAN)
+    _drain(values)
+    return first
+
+
+def _last(values: Iterator[float], count: int) -> float:
+    last = deque(values, maxlen=1)
+    return last[0] if last else _NAN
+
+
+def _median(values: Iterator[float], count: int) -> float:
+    return statistics.median(values) if count else _NAN
+
+
+_KERNELS: Dict[str, Callable[[Iterator[float], int], float]] = {
+    "mean": _mean,
+    "sum": _sum,
+    "min": _min,
+    "max": _max,
+    "count": _count,
+    "first": _first,
+    "last": _last,
+    "median": _median,
+}
+
+
+def _edges(length: int, num_bins: int, spread: bool) -> List[Tuple[int, int]]:
+    step = length / num_bins
+    edges = []
+    for d in range(num_bins):
+        lower = int(d * step)
+        upper = int((d + 1) * step)
+        if spread:
+            upper = max(upper, lower + 1)
+        edges.append((lower, upper))
+    return edges
+
+
+def _bins_numpy(
+    data, edges: List[Tuple[int, int]], summary_function: str
+) -> List[float]:
+    np = _numpy.numpy
+    lower, upper = (np.array(d, dtype=np.intp) for d in zip(*edges))
+    counts = upper - lower
+    if summary_function == "count":
+        return counts.tolist()
+    data = np.asarray(data, dtype=np.float64)
+    filled = counts > 0
+    result = np.full(len(edges), np.nan)
+    if summary_function == "first":
+        result[filled] = data[lower[filled]]
+    elif summary_function == "last":
+        result[filled] = data[upper[filled] - 1]
+    elif summary_function == "median":
+        for idx in np.flatnonzero(filled):
+            result[idx] = np.median(data[lower[idx] : upper[idx]])
+    elif len(data) >= len(edges):
+        # Bins are contiguous, values after the last bin are left out, as the
+        # last bin can end before the end of the data due to rounding
+        data = data[: upper[-1]]
+        if summary_function in ("sum", "mean"):
+            result = np.add.reduceat(data, lower)
+            if summary_function == "mean":
+                result = result / counts
+        elif summary_function == "min":
+            result = np.minimum.reduceat(data, lower)
+        else:
+            result = np.maximum.reduceat(data, lower)
+    else:
+        # Bins hold at most one value
+        result[filled] = data[lower[filled]]
+        if summary_function == "sum":
+            result[~filled] = 0.0
+    return result.tolist()
 
 
 def bins(
     data: Sequence[float],
     num_bins: int,
     *,
-    summary_function: SummaryFunction = mean,
+    summary_function: Union[SummaryFunction, SummaryKernel] = "mean",
     spread: bool = True,
 ) -> Generator[float, None, None]:
     """Resample ``data`` into ``num_bins`` bins.
 
+    Named summary kernels run in a single pass over the data, without copying
+    each bin. For NumPy arrays they are vectorized. Bins without data are
+    summarized as NaN, except for ``"count"`` and ``"sum"``.
+
     Args:
         data (Sequence[float]): Data to resample.
         num_bins (int): Number of bins
-        summary_function (SummaryFunction): Function to summarize the data in each bin. Defaults to ``mean``.
+        summary_function (Union[SummaryFunction, SummaryKernel]): Function or name of kernel ("mean", "sum", "min", "max", "count", "first", "last", "median") to summarize the data in each bin. Defaults to "mean".
         spread (bool, optional): Fill in values if ``num_bins > len(data)``. Defaults to True.
 
     Yields:
         Binned data.
     """
-    step = len(data) / num_bins
-    for d in range(num_bins):
-        lower = int(d * step)
-        upper = int((d + 1) * step)
-        if spread:
-            upper = max(upper, lower + 1)
-        segment = data[lower:upper]
-        yield summary_function(segment)
+    edges = _edges(len(data), num_bins, spread)
+    if not isinstance(summary_function, str):
+        for lower, upper in edges:
+            yield summary_function(data[lower:upper])
+        return
+    kernel = _KERNELS.get(summary_function)
+    if kernel is None:
+        raise ValueError(f"Unknown summary kernel {summary_function!r}.")
+    if _numpy.is_array(data):
+        yield from _bins_numpy(data, edges, summary_function)
+    elif len(data) >= num_bins:
+        # Bins are contiguous and cover all data
+        values = iter(data)
+        for lower, upper in edges:
+            yield kernel(islice(values, upper - lower), upper - lower)
+    else:
+        # Bins hold at most one value
+        for lower, upper in edges:
+            yield kernel(iter(data[lower:upper]), upper - lower)
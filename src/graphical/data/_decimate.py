@@ -0,0 +1,170 @@
+from itertools import islice
+from typing import Generator, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from graphical import _numpy
+from graphical.data._bins import _edges, bins
+
+
+def _sized(data: Iterable[float], length: Optional[int]) -> Tuple[Iterable[float], int]:
+    if length is not None:
+        return data, length
+    if not isinstance(data, Sequence) and not _numpy.is_array(data):
+        data = list(data)
+    return data, len(data)
+
+
+def _buckets(
+    values: Iterator[float], length: int, num_bins: int
+) -> Generator[List[float], None, None]:
+    """Split values into the bins of ``bins``, requires ``length >= num_bins``."""
+    for lower, upper in _edges(length, num_bins, spread=True):
+        yield list(islice(values, upper - lower))
+
+
+def minmax(
+    data: Iterable[float],
+    num_bins: int,
+    *,
+    length: Optional[int] = None,
+) -> Generator[Tuple[float, float], None, None]:
+    """Decimate ``data`` into a min-max envelope of ``num_bins`` bins.
+
+    Unlike a summary function, the envelope keeps spikes. Each bin can be
+    rendered as a ``Range``.
+
+    Args:
+        data (Iterable[float]): Data to decimate.
+        num_bins (int): Number of bins.
+        length (int, optional): Length of data, if data is an iterable without length. Iterables are read into a list otherwise.
+
+    Yields:
+        Minimum and maximum of each bin.
+    """
+    data, length = _sized(data, length)
+    if _numpy.is_array(data) or length < num_bins:
+        mins = bins(data, num_bins, summary_function="min")
+        maxs = bins(data, num_bins, summary_function="max")
+        yield from zip(mins, maxs)
+        return
+    for bucket in _buckets(iter(data), length, num_bins):
+        yield min(bucket), max(bucket)
+
+
+def m4(
+    data: Iterable[float],
+    num_bins: int,
+    *,
+    length: Optional[int] = None,
+) -> Generator[Tuple[float, float, float, float], None, None]:
+    """Decimate ``data`` with M4 aggregation into ``num_bins`` bins.
+
+    The first, minimum, maximum and last value of each bin are sufficient to
+    draw a line through the original data without visible errors.
+
+    Args:
+        data (Iterable[float]): Data to decimate.
+        num_bins (int): Number of bins.
+        length (int, optional): Length of data, if data is an iterable without length. Iterables are read into a list otherwise.
+
+    Yields:
+        First, minimum, maximum and last value of each bin.
+    """
+    data, length = _sized(data, length)
+    if _numpy.is_array(data) or length < num_bins:
+        yield from zip(
+            *(
+                bins(data, num_bins, summary_function=kernel)
+                for kernel in ("first", "min", "max", "last")
+            )
+        )
+        return
+    for bucket in _buckets(iter(data), length, num_bins):
+        yield bucket[0], min(bucket), max(bucket), bucket[-1]
+
+
+def _mean(bucket: Sequence[float]) -> float:
+    if _numpy.is_array(bucket):
+        return float(bucket.mean())
+    return sum(bucket) / len(bucket)
+
+
+def _lttb_select(
+    bucket: Sequence[float],
+    offset: int,
+    a: Tuple[float, float],
+    b: Tuple[float, float],
+) -> int:
+    """Index of the bucket value with the largest triangle to points a and b."""
+    ax, ay = a
+    bx, by = b
+    if _numpy.is_array(bucket):
+        np = _numpy.numpy
+        x = np.arange(offset, offset + len(bucket))
+        areas = np.abs((ax - bx) * (bucket - ay) - (ax - x) * (by - ay))
+        return int(np.argmax(areas))
+    best, best_area = 0, -1.0
+    for idx, y in enumerate(bucket):
+        area = abs((ax - bx) * (y - ay) - (ax - offset - idx) * (by - ay))
+        if area > best_area:
+            best, best_area = idx, area
+    return best
+
+
+def lttb(
+    data: Iterable[float],
+    num_points: int,
+    *,
+    length: Optional[int] = None,
+) -> Generator[float, None, None]:
+    """Decimate ``data`` to ``num_points`` values with Largest-Triangle-Three-Buckets.
+
+    Selects one value per bucket that preserves the visual shape of the data,
+    including spikes. Data with fewer values than ``num_points`` is returned as is.
+
+    Args:
+        data (Iterable[float]): Data to decimate.
+        num_points (int): Number of values, at least 3.
+        length (int, optional): Length of data, if data is an iterable without length. Iterables are read into a list otherwise.
+
+    Raises:
+        ValueError: Number of points must be at least 3.
+
+    Yields:
+        Selected values in order.
+    """
+    if num_points < 3:
+        raise ValueError("Number of points must be at least 3.")
+    data, length = _sized(data, length)
+    if length <= num_points:
+        yield from data
+        return
+    # The first and last value are kept, the values in between are split into buckets
+    num_buckets = num_points - 2
+    edges = [(d * (length - 2)) // num_buckets + 1 for d in range(num_buckets + 1)]
+    if _numpy.is_array(data):
+        first = float(data[0])
+        buckets = (data[lower:upper] for lower, upper in zip(edges, edges[1:]))
+        values = iter((float(data[-1]),))
+    else:
+        values = iter(data)
+        first = next(values)
+        buckets = (
+            list(islice(values, upper - lower))
+            for lower, upper in zip(edges, edges[1:])
+        )
+    yield first
+    a = (0.0, first)
+    current = next(buckets)
+    for d in range(num_buckets):
+        following = next(buckets, None)
+        if following is None:
+            # Last bucket is followed by the last value
+            last = next(values)
+            b = (float(length - 1), last)
+        else:
+            b = (edges[d + 1] + (len(following) - 1) / 2.0, _mean(following))
+        idx = _lttb_select(current, edges[d], a, b)
+        a = (float(edges[d] + idx), float(current[idx]))
+        yield a[1]
+        current = following
+    yield last
@@ -0,0 +1,225 @@
+"""Immutable renderables, that are hashed by content and share rendered lines.
+
+Frozen renderables take the same arguments as their mutable counterparts.
+Sequences are copied into tuples, so the content cannot change after
+construction. Renderables with equal arguments are equal and have the same
+hash, so they can be used as keys and deduplicated in sets. Rendered
+segments are kept in the shared ``RENDERS`` cache, keyed by content and
+maximum width, so equal renderables are rendered once, even if they are
+created again for every frame. Use ``replace`` to get a copy with some
+arguments changed.
+"""
+
+import inspect
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.segment import Segment
+
+from graphical import _numpy
+from graphical.bar import Bar, Range, RangeStack, Stack
+from graphical.heat import Heat
+
+T = TypeVar("T")
+F = TypeVar("F", bound="Frozen")
+
+
+class RenderCacheInfo(NamedTuple):
+    """Statistics of a render cache."""
+
+    hits: int
+    misses: int
+    size: int
+
+
+class RenderCache:
+    """Least recently used cache of rendered segments.
+
+    Args:
+        maxsize (int, optional): Number of entries after which the least recently used entry is dropped. Defaults to 1024.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, render: Callable[[], T]) -> T:
+        """Get the cached result for a key, or render and cache it."""
+        entries = self._entries
+        if key in entries:
+            self._hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+        self._misses += 1
+        result = entries[key] = render()
+        if len(entries) > self._maxsize:
+            entries.popitem(last=False)
+        return result
+
+    def info(self) -> RenderCacheInfo:
+        """Get hit and miss statistics of the cache."""
+        return RenderCacheInfo(self._hits, self._misses, len(self._entries))
+
+    def clear(self) -> None:
+        """Clear cached segments and statistics."""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+RENDERS = RenderCache()
+"""Render cache shared by all frozen renderables."""
+
+_MISSING = object()
+# Parameter names and defaults of the mutable base class of each frozen class
+_parameters: Dict[type, Tuple[Tuple[str, ...], int, Dict[str, Any]]] = {}
+
+
+def _bind(cls: type, args: Tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Bind arguments to the parameters of the mutable base class, with defaults.
+
+    Same as ``inspect.Signature.bind``, but the parameters are looked up once per class.
+    """
+    parameters = _parameters.get(cls)
+    if parameters is None:
+        mro = cls.__mro__
+        signature = inspect.signature(mro[mro.index(Frozen) + 1])
+        names = tuple(signature.parameters)
+        positional = sum(
+            d.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
+            for d in signature.parameters.values()
+        )
+        defaults = {
+            name: _MISSING if d.default is inspect.Parameter.empty else d.default
+            for name, d in signature.parameters.items()
+        }
+        parameters = _parameters[cls] = (names, positional, defaults)
+    names, positional, defaults = parameters
+    if len(args) > positional:
+        raise TypeError(f"{cls.__name__} takes {positional} positional arguments.")
+    arguments = dict(defaults)
+    arguments.update(zip(names, args))
+    for name, value in kwargs.items():
+        if name not in defaults:
+            raise TypeError(f"{cls.__name__} got an unexpected argument {name!r}.")
+        if name in names[: len(args)]:
+            raise TypeError(f"{cls.__name__} got multiple values for {name!r}.")
+        arguments[name] = value
+    missing = [name for name, value in arguments.items() if value is _MISSING]
+    if missing:
+        raise TypeError(f"{cls.__name__} is missing arguments {missing}.")
+    return arguments
+
+
+def _freeze(value: Any) -> Any:
+    """Copy sequences and arrays into nested tuples."""
+    # Named tuples, such as colors, keep their type
+    if type(value) in (list, tuple):
+        return tuple(_freeze(d) for d in value)
+    if _numpy.is_array(value):
+        return _freeze(value.tolist())
+    return value
+
+
+class Frozen:
+    """Base of immutable renderables, that are hashed by content.
+
+    Arguments are bound to the signature of the mutable base class, with
+    defaults applied, so equal content is equal regardless of how it was
+    passed. Public attributes cannot be set after construction.
+    """
+
+    _arguments: Dict[str, Any]
+    _key: Tuple
+    _hash: int
+    _frozen = False
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        arguments = {
+            name: _freeze(value)
+            for name, value in _bind(type(self), args, kwargs).items()
+        }
+        super().__init__(**arguments)
+        self._arguments = arguments
+        self._key = (type(self), *arguments.items())
+        self._hash = hash(self._key)
+        self._frozen = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen and not name.startswith("_"):
+            raise AttributeError(
+                f"{type(self).__name__} is frozen, use replace() to change {name!r}."
+            )
+        super().__setattr__(name, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Frozen):
+            return NotImplemented
+        return self._hash == other._hash and self._key == other._key
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        arguments = ", ".join(f"{k}={v!r}" for k, v in self._arguments.items())
+        return f"{type(self).__name__}({arguments})"
+
+    def replace(self: F, **changes: Any) -> F:
+        """Get a copy with some arguments changed.
+
+        Args:
+            **changes: Arguments of the constructor to change.
+
+        Returns:
+            Frozen: New renderable of the same type.
+        """
+        return type(self)(**{**self._arguments, **changes})
+
+    def __graphical_columns__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Optional[List[List[Segment]]]:
+        return RENDERS.get(
+            (self, "columns", options.max_width),
+            lambda: super(Frozen, self).__graphical_columns__(console, options),
+        )
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        return RENDERS.get(
+            (self, "segments", options.max_width),
+            lambda: list(super(Frozen, self).__rich_console__(console, options)),
+        )
+
+
+class FrozenBar(Frozen, Bar):
+    """Immutable ``Bar``, see ``Frozen``."""
+
+
+class FrozenRange(Frozen, Range):
+    """Immutable ``Range``, see ``Frozen``."""
+
+
+class FrozenStack(Frozen, Stack):
+    """Immutable ``Stack``, see ``Frozen``."""
+
+
+class FrozenRangeStack(Frozen, RangeStack):
+    """Immutable ``RangeStack``, see ``Frozen``."""
+
+
+class FrozenHeat(Frozen, Heat):
+    """Immutable ``Heat``, see ``Frozen``."""
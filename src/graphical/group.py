@@ -1,13 +1,61 @@
-from itertools import zip_longest
+from itertools import count
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
 from rich.console import Console, ConsoleOptions, RenderResult, RenderableType
 from rich.measure import Measurement
-from rich.segment import Segment
+from rich.segment import Segment, Segments
 
+from graphical._columns import ColumnBuffer
+from graphical._measure import invalidate, measure, render_scope
+from graphical.observe import Observable
 
-class Horizontal:
+
+def _columns(
+    renderable: RenderableType, console: Console, options: ConsoleOptions
+) -> Optional[List[List[Segment]]]:
+    """Get the one cell columns of a renderable, if it supports rendering as columns."""
+    method = getattr(renderable, "__graphical_columns__", None)
+    if method is None:
+        return None
+    return method(console, options)
+
+
+def _size(
+    renderable: RenderableType, console: Console, options: ConsoleOptions
+) -> Optional[Tuple[int, int]]:
+    """Get width and height of a renderable in cells, if it has a fixed size."""
+    method = getattr(renderable, "__graphical_size__", None)
+    if method is None:
+        return None
+    return method(console, options)
+
+
+def _new_line(renderable: RenderableType) -> bool:
+    """Get if the lines of a renderable with a fixed size end with a new line."""
+    method = getattr(renderable, "__graphical_new_line__", None)
+    return method is not None and method()
+
+
+def _rows(renderable: RenderableType, height: int) -> int:
+    """Get the rows a child of a given height takes in a ``Vertical``.
+
+    ``Vertical`` adds a new line after each child, which is an empty row if
+    the lines of the child already end with a new line.
+    """
+    if isinstance(renderable, Vertical) or _new_line(renderable):
+        return height + 1
+    return max(height, 1)
+
+
+class Horizontal(Observable):
     """Arranges renderables horizontally.
 
+    Renderables of a fixed size in cells, that provide their cells with
+    ``__graphical_columns__``, are written to the row buffer directly. Other
+    renderables are rendered into lines. Renderables are rendered with the
+    options of the console, so renderables wider than the group are cropped
+    rather than resized.
+
     Args:
         *renderables (RenderableType): Renderables to be arranged.
         gap (int, optional): Gap between renderables. Defaults to 0.
@@ -20,34 +68,69 @@ class Horizontal:
     def append(self, renderable: RenderableType):
         """Add renderable as group."""
         self._renderables.append(renderable)
+        self._observe_child(renderable)
+        self.changed()
+        invalidate()
+
+    def _children(self) -> Iterable[RenderableType]:
+        return self._renderables
 
     def __rich_measure__(
         self, console: Console, options: ConsoleOptions
     ) -> Measurement:
         mins = []
         maxs = []
-        for renderable in self._renderables:
-            _min, _max = Measurement.get(console, options, renderable)
-            mins.append(_min)
-            maxs.append(_max)
+        with render_scope():
+            for renderable in self._renderables:
+                _min, _max = measure(console, options, renderable)
+                mins.append(_min)
+                maxs.append(_max)
         return Measurement(sum(mins), sum(maxs))
 
+    def __graphical_size__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Optional[Tuple[int, int]]:
+        sizes = [_size(d, console, console.options) for d in self._renderables]
+        if not sizes or None in sizes:
+            return None
+        width = sum(w for w, _ in sizes) + self._gap * (len(sizes) - 1)
+        return width, max(h for _, h in sizes)
+
+    def _render_child(
+        self, renderable: RenderableType, console: Console, options: ConsoleOptions
+    ) -> Tuple[Optional[List[List[Segment]]], Optional[List[List[Segment]]]]:
+        """Render a child into columns, or into lines if it has no columns."""
+        columns = _columns(renderable, console, options)
+        if columns is None:
+            return None, console.render_lines(renderable, options, pad=False)
+        return columns, None
+
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
+        buffer = ColumnBuffer()
+        options = console.options
+        with render_scope():
+            for idx, renderable in enumerate(self._renderables):
+                if idx > 0:
+                    buffer.write_gap(self._gap)
+                columns, lines = self._cached(
+                    renderable,
+                    options,
+                    lambda: self._render_child(renderable, console, options),
+                )
+                if columns is None:
+                    buffer.write_lines(lines)
+                else:
+                    buffer.write_columns(columns)
         new_line = Segment.line()
-        rendered = [console.render_lines(d, pad=False) for d in self._renderables]
-        for row_idx, row in enumerate(zip_longest(*rendered)):
+        for row_idx, row in enumerate(buffer.rows()):
             if row_idx > 0:
                 yield new_line
-            for col_idx, cell in enumerate(row):
-                if col_idx > 0 and self._gap > 0:
-                    yield Segment(" " * self._gap)
-                if cell is not None:
-                    yield from cell
+            yield from row
 
 
-class Vertical:
+class Vertical(Observable):
     """Arranges renderables vertically.
 
     Args:
@@ -62,24 +145,131 @@ class Vertical:
     def append(self, renderable: RenderableType):
         """Add renderable as group."""
         self._renderables.append(renderable)
+        self._observe_child(renderable)
+        self.changed()
+        invalidate()
+
+    def _children(self) -> Iterable[RenderableType]:
+        return self._renderables
 
     def __rich_measure__(
         self, console: Console, options: ConsoleOptions
     ) -> Measurement:
         mins = []
         maxs = []
-        for renderable in self._renderables:
-            _min, _max = Measurement.get(console, options, renderable)
-            mins.append(_min)
-            maxs.append(_max)
+        with render_scope():
+            for renderable in self._renderables:
+                _min, _max = measure(console, options, renderable)
+                mins.append(_min)
+                maxs.append(_max)
         return Measurement(max(mins), max(maxs))
 
+    def __graphical_size__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Optional[Tuple[int, int]]:
+        sizes = [_size(d, console, options) for d in self._renderables]
+        if not sizes or None in sizes:
+            return None
+        rows = [_rows(d, h) for d, (_, h) in zip(self._renderables, sizes)]
+        height = sum(rows) + self._gap * (len(sizes) - 1)
+        return max(w for w, _ in sizes), height
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        new_line = Segment.line()
+        with render_scope():
+            for row_idx, renderable in enumerate(self._renderables):
+                if row_idx > 0 and self._gap > 0:
+                    yield from [new_line] * self._gap
+                if self._rendered is None or not isinstance(renderable, Observable):
+                    yield renderable
+                else:
+                    yield Segments(
+                        self._cached(
+                            renderable,
+                            options,
+                            lambda: list(
+                                console.render(renderable, options.reset_height())
+                            ),
+                        )
+                    )
+                yield new_line
+
+
+RowFactory = Callable[[int], Optional[RenderableType]]
+
+
+class VerticalStream:
+    """Arranges a stream of renderables vertically, without keeping them in memory.
+
+    Rows are created and rendered one at a time. Each row takes the lines it
+    renders to. Use ``print`` to write the rows to a console in windows of
+    lines, so memory is bounded by the window instead of the number of rows.
+
+    Args:
+        rows (Union[Iterable[RenderableType], RowFactory]): Renderables, or a function that returns the renderable of a row index and None after the last row. Iterators can be rendered once.
+        gap (int, optional): Gap between renderables. Defaults to 0.
+        window (int, optional): Number of lines written at once by ``print``. Defaults to 1000.
+    """
+
+    def __init__(
+        self,
+        rows: Union[Iterable[RenderableType], RowFactory],
+        *,
+        gap: int = 0,
+        window: int = 1000,
+    ) -> None:
+        self._rows = rows
+        self._gap = gap
+        self.window = window
+
+    def rows(self) -> Iterator[RenderableType]:
+        """Iterate over the renderables of the rows."""
+        if not callable(self._rows):
+            yield from self._rows
+            return
+        for idx in count():
+            row = self._rows(idx)
+            if row is None:
+                return
+            yield row
+
+    def lines(
+        self, console: Console, options: ConsoleOptions
+    ) -> Iterator[List[Segment]]:
+        """Render the rows lazily.
+
+        Yields:
+            List[Segment]: The next line.
+        """
+        for row_idx, renderable in enumerate(self.rows()):
+            if row_idx > 0:
+                yield from [[] for _ in range(self._gap)]
+            with render_scope():
+                yield from console.render_lines(renderable, options, pad=False)
+
+    def print(self, console: Console) -> None:
+        """Write the rows to a console, one window of lines at a time.
+
+        Args:
+            console (Console): The console to write to, a terminal or a file.
+        """
+        new_line = Segment.line()
+        segments: List[Segment] = []
+        for line_idx, line in enumerate(self.lines(console, console.options), 1):
+            segments += line
+            segments.append(new_line)
+            if line_idx % self.window == 0:
+                console.print(Segments(segments), end="")
+                segments = []
+        if segments:
+            console.print(Segments(segments), end="")
+
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
         new_line = Segment.line()
-        for row_idx, renderable in enumerate(self._renderables):
-            if row_idx > 0 and self._gap > 0:
-                yield from [new_line] * self._gap
-            yield renderable
+        for line in self.lines(console, options):
+            yield from line
             yield new_line
@@ -1,17 +1,20 @@
-from typing import Optional, Tuple, Union
+from itertools import zip_longest
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from rich.color import Color
 from rich.console import Console, ConsoleOptions, RenderResult
 from rich.measure import Measurement
 from rich.segment import Segment
-from rich.style import Style
 
+from graphical._segment import simplify
 from graphical.options import Orientation
 from graphical.data import normalize
+from graphical.observe import Observable, Observed
 from graphical.scale.chromatic import SequentialScheme
+from graphical.style import STYLES
 
 
-class Heat:
+class Heat(Observable):
     """Single or double value cell for a heatmap or density graph.
 
     Args:
@@ -23,6 +26,8 @@ class Heat:
         repeat_y (int, optional): Repeat (lengthen) heat cell vertically. No repeats if None.
     """
 
+    data = Observed()
+
     def __init__(
         self,
         data: Union[float, Tuple[float, float]],
@@ -40,22 +45,39 @@ class Heat:
         self.repeat_x = repeat_x
         self.repeat_y = repeat_y
 
-    def __rich_console__(
-        self, console: Console, options: ConsoleOptions
-    ) -> RenderResult:
+    def _cell(self) -> Segment:
         data = self.data if isinstance(self.data, tuple) else [self.data]
         data = list(normalize(data, self.value_range))
         colors = [
             self.scheme.get(d) if d is not None else Color.default() for d in data
         ]
+        if len(data) == 1:
+            return Segment(" ", style=STYLES.get(bgcolor=colors[0]))
+        elif self.orientation == "horizontal":
+            return Segment("▌", style=STYLES.get(colors[0], colors[1]))
+        else:
+            return Segment("▄", style=STYLES.get(colors[1], colors[0]))
+
+    def __graphical_size__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Optional[Tuple[int, int]]:
+        return self.repeat_x or 1, self.repeat_y or 1
+
+    def __graphical_new_line__(self) -> bool:
+        return bool(self.repeat_y)
+
+    def __graphical_columns__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Optional[List[List[Segment]]]:
+        return [[self._cell()] * (self.repeat_y or 1)] * (self.repeat_x or 1)
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        cell = self._cell()
         for _ in range(self.repeat_y or 1):
             for _ in range(self.repeat_x or 1):
-                if len(data) == 1:
-                    yield Segment(" ", style=Style(bgcolor=colors[0]))
-                elif self.orientation == "horizontal":
-                    yield Segment("▌", style=Style(color=colors[0], bgcolor=colors[1]))
-                else:
-                    yield Segment("▄", style=Style(color=colors[1], bgcolor=colors[0]))
+                yield cell
             if self.repeat_y:
                 yield Segment.line()
 
@@ -63,3 +85,112 @@ class Heat:
         self, console: Console, options: ConsoleOptions
     ) -> Measurement:
         return Measurement(1, 1)
+
+
+class HeatMap(Observable):
+    """Heatmap or density graph of a two dimensional grid of values.
+
+    Renders each line directly, instead of arranging one ``Heat`` per value in groups.
+
+    Args:
+        data (Sequence[Sequence[Optional[float]]]): The values, row by row. Missing values are None or NaN.
+        value_range (Tuple[float, float]): Lower and upper boundary.
+        scheme (SequentialScheme): Color scheme.
+        orientation (Literal["horizontal", "vertical"], optional): Pack two values per cell, either two columns or two rows. One value per cell if None.
+        repeat_x (int, optional): Repeat (widen) heat cells horizontally. No repeats if None.
+        repeat_y (int, optional): Repeat (lengthen) heat cells vertically. No repeats if None.
+    """
+
+    data = Observed()
+
+    def __init__(
+        self,
+        data: Sequence[Sequence[Optional[float]]],
+        value_range: Tuple[float, float],
+        scheme: SequentialScheme,
+        *,
+        orientation: Optional[Orientation] = None,
+        repeat_x: Optional[int] = None,
+        repeat_y: Optional[int] = None,
+    ) -> None:
+        self.data = data
+        self.value_range = value_range
+        self.scheme = scheme
+        self.orientation = orientation
+        self.repeat_x = repeat_x
+        self.repeat_y = repeat_y
+
+    def _cell(self, a: int, b: Optional[int], colors: List[Color]) -> Segment:
+        text = " " * (self.repeat_x or 1)
+        if b is None:
+            # One value per cell
+            if a < 0:
+                return Segment(text)
+            return Segment(text, style=STYLES.get(bgcolor=colors[a]))
+        # First and second value are left and right or top and bottom
+        if self.orientation == "horizontal":
+            first, second = "▌", "▐"
+        else:
+            first, second = "▀", "▄"
+        if a < 0 and b < 0:
+            return Segment(text)
+        if b < 0:
+            return Segment(first * len(text), style=STYLES.get(colors[a]))
+        if a < 0:
+            return Segment(second * len(text), style=STYLES.get(colors[b]))
+        if self.orientation == "horizontal":
+            return Segment(first * len(text), style=STYLES.get(colors[a], colors[b]))
+        return Segment(second * len(text), style=STYLES.get(colors[b], colors[a]))
+
+    def _indices(self) -> List[List[int]]:
+        result = []
+        for row in self.data:
+            indices = self.scheme.indices(row, self.value_range)
+            result.append(indices if isinstance(indices, list) else indices.tolist())
+        return result
+
+    def lines(self) -> Iterable[List[Segment]]:
+        """Returns the rendered lines without repeats along the y axis.
+
+        Yields:
+            List[Segment]: Simplified segments of the next line.
+        """
+        colors = self.scheme.table
+        rows = self._indices()
+        if self.orientation == "vertical":
+            keys: Iterable[Iterable[Tuple[int, Optional[int]]]] = (
+                zip_longest(top, bottom, fillvalue=-1)
+                for top, bottom in zip_longest(rows[::2], rows[1::2], fillvalue=[])
+            )
+        elif self.orientation == "horizontal":
+            keys = (zip_longest(row[::2], row[1::2], fillvalue=-1) for row in rows)
+        else:
+            keys = (((d, None) for d in row) for row in rows)
+        cells: Dict[Tuple[int, Optional[int]], Segment] = {}
+        for line in keys:
+            segments = []
+            for key in line:
+                cell = cells.get(key)
+                if cell is None:
+                    cell = cells[key] = self._cell(*key, colors)
+                segments.append(cell)
+            yield list(simplify(segments))
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        new_line = Segment.line()
+        for row_idx, line in enumerate(self.lines()):
+            for repeat_idx in range(self.repeat_y or 1):
+                if row_idx > 0 or repeat_idx > 0:
+                    yield new_line
+                yield from line
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        width = max((len(row) for row in self.data), default=0)
+        if self.orientation == "horizontal":
+            width = (width + 1) // 2
+        width *= self.repeat_x or 1
+        return Measurement(width, width)
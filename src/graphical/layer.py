@@ -1,85 +1,362 @@
-from itertools import zip_longest
-from typing import Callable, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from rich.console import Console, ConsoleOptions, RenderResult, RenderableType
 from rich.measure import Measurement
 from rich.segment import Segment
 from rich.style import Style
 
-
-BlendFunction = Callable[[Segment, Segment], Segment]
+from graphical._measure import invalidate, measure, render_scope
+from graphical.group import _size
+from graphical.observe import Observable
+from graphical.style import SharedStyle
 
 
-def _segments(
-    renderable: RenderableType, console: Console, options: ConsoleOptions
-) -> List[List[Segment]]:
-    result = []
-    lines = console.render_lines(
-        renderable,
-        options,
-        pad=False,
-    )
-    for line in lines:
-        _line = []
-        for segment in line:
-            _line += [*(Segment(s, segment.style) for s in segment.text)]
-        result.append(_line)
-    return result
+BlendFunction = Callable[[Segment, Segment], Segment]
 
 
 def _blend(a: Segment, b: Segment) -> Segment:
     if b.text != " ":
         style = (a.style or Style.null()) + (b.style or Style(color="default"))
-        return Segment(b.text, style)
+        return Segment(b.text, SharedStyle.share(style))
     if b.style and b.style.bgcolor and b.style.bgcolor != "default":
         return b
     return a
 
 
-class Layers:
+class _CellGrid:
+    """Canvas of cells that layers are blended into.
+
+    Each row is stored as parallel lists of characters and style ids. Styles
+    are interned, so blending two cells with the default blend function is a
+    lookup of the pair of style ids. Cells covered by an opaque layer are
+    owned by that layer and layers below are not blended into them.
+
+    Args:
+        blend (BlendFunction, optional): Function to blend cells, if not the default blend function.
+    """
+
+    def __init__(self, blend: Optional[BlendFunction] = None) -> None:
+        self._blend = blend
+        self.chars: List[List[str]] = []
+        self.style_ids: List[List[int]] = []
+        # Index of the opaque layer that owns a cell, -1 if not owned
+        self.owners: List[List[int]] = []
+        # Style id 0 is no style
+        self._styles: List[Optional[Style]] = [None]
+        self._ids: Dict[Optional[Style], int] = {None: 0}
+        self._opaque: List[bool] = [False]
+        self._combined: Dict[Tuple[int, int], int] = {}
+
+    def _style_id(self, style: Optional[Style]) -> int:
+        style_id = self._ids.get(style)
+        if style_id is None:
+            style_id = self._ids[style] = len(self._styles)
+            self._styles.append(style)
+            bgcolor = style.bgcolor if style else None
+            self._opaque.append(bool(bgcolor and bgcolor != "default"))
+        return style_id
+
+    def _combine(self, a: int, b: int) -> int:
+        key = (a, b)
+        style_id = self._combined.get(key)
+        if style_id is None:
+            style = (self._styles[a] or Style.null()) + (
+                self._styles[b] or Style(color="default")
+            )
+            # Sums of styles are cached by Rich and shared between consoles
+            style = SharedStyle.share(style)
+            style_id = self._combined[key] = self._style_id(style)
+        return style_id
+
+    def _row(self, y: int) -> Tuple[List[str], List[int]]:
+        while len(self.chars) <= y:
+            self.chars.append([])
+            self.style_ids.append([])
+        return self.chars[y], self.style_ids[y]
+
+    def cover(
+        self, lines: Iterable[List[Segment]], layer: int, paint: bool = False
+    ) -> None:
+        """Mark the cells of an opaque layer as owned, if no layer above owns them.
+
+        Opaque layers must be covered front to back, starting with the top layer.
+        Blank cells, a space without background, are not covered.
+
+        Args:
+            lines (Iterable[List[Segment]]): Lines of the layer.
+            layer (int): Index of the layer.
+            paint (bool, optional): Also write the owned cells, if no layer above is blended into them and blank cells are transparent. Defaults to False.
+        """
+        ids = self._ids
+        for y, line in enumerate(lines):
+            while len(self.owners) <= y:
+                self.owners.append([])
+            owners = self.owners[y]
+            width = sum(len(segment.text) for segment in line)
+            # Rows are created even if empty or hidden, to keep the height of the layer
+            chars, style_ids = self._row(y) if paint else ([], [])
+            if len(owners) < width:
+                owners.extend([-1] * (width - len(owners)))
+            elif width and min(owners[:width]) >= 0:
+                # Row is hidden by opaque layers above
+                continue
+            if len(chars) < width and paint:
+                padding = width - len(chars)
+                chars.extend(" " * padding)
+                style_ids.extend([0] * padding)
+            x = 0
+            for text, style, _ in line:
+                end = x + len(text)
+                style_id = ids.get(style)
+                if style_id is None:
+                    style_id = self._style_id(style)
+                opaque = self._opaque[style_id]
+                if not text or (not opaque and text.count(" ") == len(text)):
+                    x = end
+                    continue
+                hidden = owners[x:end]
+                if min(hidden) >= 0:
+                    # Cells are owned by layers above
+                    pass
+                elif max(hidden) < 0 and (opaque or " " not in text):
+                    owners[x:end] = [layer] * len(text)
+                    if paint:
+                        chars[x:end] = text
+                        style_ids[x:end] = [style_id] * len(text)
+                else:
+                    for offset, char in enumerate(text, x):
+                        if owners[offset] < 0 and (opaque or char != " "):
+                            owners[offset] = layer
+                            if paint:
+                                chars[offset] = char
+                                style_ids[offset] = style_id
+                x = end
+
+    def hidden(self, width: int, height: int) -> bool:
+        """Check if all cells of a layer of given size are owned by opaque layers."""
+        if len(self.owners) < height:
+            return False
+        return all(
+            len(owners) >= width and min(owners[:width], default=0) >= 0
+            for owners in self.owners[:height]
+        )
+
+    def paint(self, lines: Iterable[List[Segment]], layer: int = 0) -> None:
+        """Blend lines of segments into the grid, starting at the top left cell.
+
+        Cells owned by an opaque layer are replaced by that layer and not
+        blended with layers below.
+        """
+        for y, line in enumerate(lines):
+            owners = self.owners[y] if y < len(self.owners) else []
+            if owners:
+                width = sum(len(text) for text, _, _ in line)
+                if width <= len(owners) and min(owners[:width], default=-1) > layer:
+                    # Row is hidden by opaque layers above
+                    continue
+            chars, style_ids = self._row(y)
+            x = 0
+            for text, style, _ in line:
+                style_id = self._style_id(style)
+                end = x + len(text)
+                if len(chars) < end:
+                    padding = end - len(chars)
+                    chars.extend(" " * padding)
+                    style_ids.extend([0] * padding)
+                blank = not self._opaque[style_id] and text.count(" ") == len(text)
+                if blank and self._blend is None:
+                    # Blank cells do not change the grid
+                    pass
+                elif owners and max(owners[x:end], default=-1) >= layer:
+                    self._paint_owned(chars, style_ids, owners, x, text, style, layer)
+                elif self._blend is not None:
+                    self._paint_custom(chars, style_ids, x, text, style)
+                elif self._opaque[style_id]:
+                    for offset, char in enumerate(text, x):
+                        if char == " ":
+                            chars[offset] = char
+                            style_ids[offset] = style_id
+                        else:
+                            chars[offset] = char
+                            style_ids[offset] = self._combine(
+                                style_ids[offset], style_id
+                            )
+                else:
+                    for offset, char in enumerate(text, x):
+                        if char != " ":
+                            chars[offset] = char
+                            style_ids[offset] = self._combine(
+                                style_ids[offset], style_id
+                            )
+                x = end
+
+    def _paint_owned(
+        self,
+        chars: List[str],
+        style_ids: List[int],
+        owners: List[int],
+        x: int,
+        text: str,
+        style: Optional[Style],
+        layer: int,
+    ) -> None:
+        end = x + len(text)
+        style_id = self._style_id(style)
+        hidden = owners[x:end]
+        if len(hidden) == len(text) and min(hidden) > layer:
+            # Segment is hidden by opaque layers above
+            return
+        if len(hidden) == len(text) and min(hidden) == layer == max(hidden):
+            chars[x:end] = text
+            style_ids[x:end] = [style_id] * len(text)
+            return
+        for offset, char in enumerate(text, x):
+            owner = owners[offset] if offset < len(owners) else -1
+            if owner == layer:
+                chars[offset] = char
+                style_ids[offset] = style_id
+            elif owner < layer:
+                self._paint_cell(chars, style_ids, offset, char, style, style_id)
+
+    def _paint_cell(
+        self,
+        chars: List[str],
+        style_ids: List[int],
+        offset: int,
+        char: str,
+        style: Optional[Style],
+        style_id: int,
+    ) -> None:
+        if self._blend is not None:
+            self._paint_custom(chars, style_ids, offset, char, style)
+        elif char != " ":
+            chars[offset] = char
+            style_ids[offset] = self._combine(style_ids[offset], style_id)
+        elif self._opaque[style_id]:
+            chars[offset] = char
+            style_ids[offset] = style_id
+
+    def _paint_custom(
+        self,
+        chars: List[str],
+        style_ids: List[int],
+        x: int,
+        text: str,
+        style: Optional[Style],
+    ) -> None:
+        blend = self._blend
+        styles = self._styles
+        for offset, char in enumerate(text, x):
+            a = Segment(chars[offset], styles[style_ids[offset]])
+            segment = blend(a, Segment(char, style))
+            chars[offset] = segment.text
+            style_ids[offset] = self._style_id(segment.style)
+
+    def lines(self) -> Iterator[List[Segment]]:
+        """Encode rows into lines of segments, one segment per run of equal style."""
+        styles = self._styles
+        for chars, style_ids in zip(self.chars, self.style_ids):
+            line = []
+            start = 0
+            for end in range(1, len(style_ids) + 1):
+                if end == len(style_ids) or style_ids[end] != style_ids[start]:
+                    line.append(
+                        Segment("".join(chars[start:end]), styles[style_ids[start]])
+                    )
+                    start = end
+            yield line
+
+
+class Layers(Observable):
     """Stacks and blends renderables as layers.
 
     Args:
         *renderables (RenderableType): Renderables to be stacked.
         blend (BlendFunction, optional): Function that defines how two one-cell segments are blended.
+        opaque (bool, optional): Hint that the layers hide the layers below. Defaults to False.
+
+    Cells of an opaque layer that are not blank, a space without background,
+    replace the cells below instead of being blended with them. Opaque layers
+    are composited front to back, so rows and segments that are hidden by an
+    opaque layer above are skipped, and layers of a fixed size in cells that
+    are hidden completely are not rendered.
     """
 
     def __init__(
         self,
         *renderables: RenderableType,
         blend: Optional[BlendFunction] = None,
+        opaque: bool = False,
     ) -> None:
         self._renderables = list(renderables)
         self._blend = blend or _blend
+        self.opaque = opaque
+        self._opaque = [opaque] * len(self._renderables)
 
-    def append(self, renderable: RenderableType):
-        """Add renderable as layer."""
+    def append(self, renderable: RenderableType, opaque: Optional[bool] = None):
+        """Add renderable as layer.
+
+        Args:
+            renderable (RenderableType): The renderable.
+            opaque (bool, optional): Hint that the layer hides the layers below. Defaults to the ``opaque`` of the layers.
+        """
         self._renderables.append(renderable)
+        self._opaque.append(self.opaque if opaque is None else opaque)
+        self._observe_child(renderable)
+        self.changed()
+        invalidate()
+
+    def _children(self) -> Iterable[RenderableType]:
+        return self._renderables
 
     def __rich_measure__(
         self, console: Console, options: ConsoleOptions
     ) -> Measurement:
         mins = []
         maxs = []
-        for renderable in self._renderables:
-            _min, _max = Measurement.get(console, options, renderable)
-            mins.append(_min)
-            maxs.append(_max)
+        with render_scope():
+            for renderable in self._renderables:
+                _min, _max = measure(console, options, renderable)
+                mins.append(_min)
+                maxs.append(_max)
         return Measurement(max(mins), max(maxs))
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        rendered = [_segments(r, console, options) for r in self._renderables]
-        for lines in zip_longest(*rendered, fillvalue=[]):
-            segments = []
-            for cells in [d for d in zip_longest(*lines)]:
-                segment = Segment(" ")
-                for cell in [d for d in cells if d]:
-                    segment = self._blend(segment, cell)
-                segments.append(segment)
-            yield from Segment.simplify(segments)
-            yield Segment.line()
+        grid = _CellGrid(None if self._blend is _blend else self._blend)
+        # Opaque layers on top replace all cells below, they are painted front to
+        # back if blank cells are transparent
+        top = len(self._renderables)
+        while top and self._opaque[top - 1] and self._blend is _blend:
+            top -= 1
+        # Layers are rendered front to back, layers of a fixed size that are
+        # hidden by opaque layers above are not rendered
+        rendered: List[Optional[List[List[Segment]]]] = [None] * top
+        with render_scope():
+            for layer in reversed(range(len(self._renderables))):
+                renderable = self._renderables[layer]
+                size = _size(renderable, console, options)
+                if size is not None and grid.hidden(*size):
+                    continue
+                lines = self._cached(
+                    renderable,
+                    options,
+                    lambda: console.render_lines(renderable, options, pad=False),
+                )
+                if layer >= top:
+                    grid.cover(lines, layer, paint=True)
+                    continue
+                if self._opaque[layer]:
+                    grid.cover(lines, layer)
+                rendered[layer] = lines
+        for layer, lines in enumerate(rendered):
+            if lines is not None:
+                grid.paint(lines, layer)
+        new_line = Segment.line()
+        for line in grid.lines():
+            yield from line
+            yield new_line
 
 
 if __name__ == "__main__":
@@ -0,0 +1,220 @@
+from types import TracebackType
+from typing import Dict, List, Optional, Tuple, Type
+
+from rich.cells import get_character_cell_size
+from rich.console import Console, RenderableType
+from rich.segment import Segment
+from rich.style import Style
+
+from graphical._segment import simplify
+from graphical.render import COLOR_SYSTEMS, _encode_line, _escapes
+
+Cell = Tuple[str, Optional[Style]]
+Grid = List[List[Cell]]
+
+_BLANK: Cell = (" ", None)
+# Second cell of a double width character
+_WIDE = ""
+# Runs of changed cells are joined, if fewer cells are between them, because
+# writing the cells is cheaper than moving the cursor and restyling
+_JOIN_GAP = 8
+
+_HIDE_CURSOR = "\x1b[?25l"
+_SHOW_CURSOR = "\x1b[?25h"
+_ERASE_LINE = "\x1b[K"
+_ERASE_BELOW = "\x1b[J"
+
+
+def _split(text: str) -> List[str]:
+    """Split text into the texts of its cells."""
+    cells: List[str] = []
+    for char in text:
+        size = get_character_cell_size(char)
+        if size == 1:
+            cells.append(char)
+        elif size == 2:
+            cells += [char, _WIDE]
+        elif cells:
+            # Zero width characters are combined with the previous cell
+            cells[-1] += char
+    return cells
+
+
+def _cells(
+    line: List[Segment], width: int, color: bool, splits: Dict[str, List[str]]
+) -> List[Cell]:
+    """Split a line into cells, padded with blank cells to width."""
+    cells: List[Cell] = []
+    for text, style, control in line:
+        if control:
+            continue
+        split = splits.get(text)
+        if split is None:
+            split = splits[text] = _split(text)
+        style = style if color else None
+        cells += [(cell, style) for cell in split]
+    return cells[:width] + [_BLANK] * (width - len(cells))
+
+
+def _extent(cells: List[Cell]) -> int:
+    """Number of cells without the blank cells at the end."""
+    end = len(cells)
+    while end > 0 and cells[end - 1] == _BLANK:
+        end -= 1
+    return end
+
+
+class LiveDiff:
+    """Updates a frame on a terminal in place, redrawing only the cells that changed.
+
+    Keeps the cells of the previous frame. Each update renders the new frame,
+    compares it to the previous one row by row and writes cursor movements
+    and the runs of changed cells. If the changes take more bytes than the
+    frame, or the height of the frame changes, the frame is redrawn. Use
+    instead of ``rich.live.Live`` for dashboards that change a few cells at a
+    time. Frames must fit on the terminal.
+
+    Args:
+        console (Console, optional): Terminal console to write to. Defaults to a new console.
+        width (int, optional): Width of the frame. Defaults to the console width.
+    """
+
+    def __init__(
+        self, console: Optional[Console] = None, *, width: Optional[int] = None
+    ) -> None:
+        self.console = console or Console()
+        self.width = width
+        self._grid: Optional[Grid] = None
+        # Cursor position relative to the top left cell of the frame, the
+        # column is None if it is unknown after writing to the last column
+        self._row = 0
+        self._column: Optional[int] = 0
+
+    def _encode(self, cells: List[Cell]) -> str:
+        color_system = COLOR_SYSTEMS[self.console.color_system or "standard"]
+        segments = simplify(Segment(text, style) for text, style in cells)
+        return "".join(_encode_line(segments, _escapes[color_system], color_system))
+
+    def _move(self, row: int, column: int) -> str:
+        """Move the cursor to a cell of the frame."""
+        moves = []
+        if row < self._row:
+            moves.append(f"\x1b[{self._row - row}A")
+        elif row > self._row:
+            moves.append(f"\x1b[{row - self._row}B")
+        if column != self._column:
+            moves.append("\r" if column == 0 else f"\x1b[{column + 1}G")
+        self._row, self._column = row, column
+        return "".join(moves)
+
+    def _advance(self, column: int, width: int) -> None:
+        self._column = column if column < width else None
+
+    def _redraw(self, grid: Grid, width: int) -> str:
+        output = [self._move(0, 0)] if self._grid is not None else []
+        for row, cells in enumerate(grid):
+            if row > 0:
+                output.append("\n")
+            # Lines are erased before they are written, so blank cells at the
+            # end are skipped. Erasing after writing to the last column would
+            # erase the last cell on some terminals.
+            output.append(_ERASE_BELOW if row == len(grid) - 1 else _ERASE_LINE)
+            end = _extent(cells)
+            output.append(self._encode(cells[:end]))
+            self._row = row
+            self._advance(end, width)
+        return "".join(output)
+
+    def _changes(self, grid: Grid, width: int) -> str:
+        output = []
+        for row, (cells, previous) in enumerate(zip(grid, self._grid or [])):
+            if cells == previous:
+                continue
+            changed = [idx for idx in range(width) if cells[idx] != previous[idx]]
+            # Runs of changed cells, joined if the cells between them are cheaper than a move
+            runs: List[List[int]] = []
+            for idx in changed:
+                if runs and idx - runs[-1][1] <= _JOIN_GAP:
+                    runs[-1][1] = idx + 1
+                else:
+                    runs.append([idx, idx + 1])
+            for start, end in runs:
+                if cells[start][0] == _WIDE:
+                    start -= 1
+                if end < width and cells[end][0] == _WIDE:
+                    end += 1
+                output.append(self._move(row, start))
+                output.append(self._encode(cells[start:end]))
+                self._advance(end, width)
+        return "".join(output)
+
+    def diff(self, renderable: RenderableType) -> str:
+        """Render a frame and get the output that updates the previous frame.
+
+        Args:
+            renderable (RenderableType): The new frame.
+
+        Returns:
+            str: Text with escape codes to write to the terminal.
+        """
+        console = self.console
+        width = self.width or console.width
+        options = console.options.update_width(width)
+        lines = console.render_lines(renderable, options, pad=False)
+        color = console.color_system is not None
+        splits: Dict[str, List[str]] = {}
+        grid = [_cells(line, width, color, splits) for line in lines]
+        if self._grid is None or len(grid) != len(self._grid):
+            output = self._redraw(grid, width)
+        else:
+            cursor = self._row, self._column
+            output = self._changes(grid, width)
+            # Each cell and line of the frame takes at least one character
+            if len(output) >= sum(map(_extent, grid)) + len(grid):
+                changed = self._row, self._column
+                self._row, self._column = cursor
+                redraw = self._redraw(grid, width)
+                if len(redraw) <= len(output):
+                    output = redraw
+                else:
+                    self._row, self._column = changed
+        self._grid = grid
+        return output
+
+    def update(self, renderable: RenderableType) -> int:
+        """Render a frame and write the changes to the console.
+
+        Args:
+            renderable (RenderableType): The new frame.
+
+        Returns:
+            int: Number of characters written.
+        """
+        output = self.diff(renderable)
+        file = self.console.file
+        file.write(output)
+        file.flush()
+        return len(output)
+
+    def reset(self) -> None:
+        """Forget the previous frame, so the next frame is drawn below the cursor."""
+        self._grid = None
+        self._row = 0
+        self._column = 0
+
+    def __enter__(self) -> "LiveDiff":
+        self.console.file.write(_HIDE_CURSOR)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        file = self.console.file
+        if self._grid is not None:
+            file.write(self._move(len(self._grid) - 1, 0) + "\n")
+        file.write(_SHOW_CURSOR)
+        file.flush()
+        self.reset()
@@ -1,14 +1,22 @@
 import math
 from typing import Optional, Tuple, Union
 
+FULL_BLOCK = "█"
+
 
 class Mark:
     """Defines the range of characters to render a mark.
 
+    Glyphs are looked up by level, the index of a value quantized to the
+    resolution of the mark. Positive levels index the positive mark chars,
+    negative levels ``-1 - index`` the negative mark chars.
+
+    Marks are immutable and compare equal if they have the same chars, caps
+    and invertibility.
+
     Args:
         positive (str): Mark chars for positive value.
         negative (str, optional): Mark chars for negative values. Defaults to positive.
-
     """
 
     def __init__(
@@ -25,16 +33,79 @@ class Mark:
         else:
             self._caps = caps
         self._invertible = invertible
+        # Lookup tables indexed by level + offset
+        self._scale_pos = len(self._positive) - 1
+        self._scale_neg = len(self._negative) - 1
+        self._offset = len(self._negative)
+        self._glyphs = self._negative[::-1] + self._positive
+        self._full = tuple(c == FULL_BLOCK for c in self._glyphs)
+
+    def _key(self) -> Tuple:
+        return (self._positive, self._negative, self._caps, self._invertible)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mark):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
 
     @property
     def invertible(self):
         return self._invertible
 
+    def level(self, value: float, invert: bool = False) -> int:
+        """Quantizes a value in the domain [-1, 1] to a level of this mark.
+
+        The value is not checked against the domain.
+
+        Args:
+            value (float): Value in the domain [-1, 1].
+            invert (bool, optional): Get level of inverted character. Defaults to False.
+
+        Returns:
+            int: Level of the value.
+        """
+        if invert:
+            return int(round((1 - abs(value)) * self._scale_pos))
+        if value >= 0:
+            return int(round(value * self._scale_pos))
+        return -1 - int(round(-value * self._scale_neg))
+
+    def glyph(self, level: int) -> str:
+        """Get the character for a level.
+
+        Args:
+            level (int): Level as returned by ``level``.
+
+        Returns:
+            str: Character representing the level.
+        """
+        return self._glyphs[level + self._offset]
+
+    def is_full(self, level: int) -> bool:
+        """Returns if the character for a level is a full block."""
+        return self._full[level + self._offset]
+
     def cap(self, value: float, invert: bool = False) -> str:
+        """Get the cap character for a value, by the sign of the value.
+
+        Caps are not looked up by level, negative zero has the level of zero
+        but the negative cap. The sign bit is only tested for zero.
+
+        Args:
+            value (float): Value in the domain [-1, 1].
+            invert (bool, optional): Get inverted character, if the mark has no caps. Defaults to False.
+
+        Returns:
+            str: Cap character for the value.
+        """
         if self._caps:
-            return self._caps[0] if math.copysign(1.0, value) > 0 else self._caps[1]
-        else:
-            return self.get(value, invert)
+            if value > 0.0 or (not value < 0.0 and math.copysign(1.0, value) > 0):
+                return self._caps[0]
+            return self._caps[1]
+        return self.get(value, invert)
 
     def get(self, value: float, invert: bool = False) -> str:
         """Maps a value in the domain [-1, 1] to the corresponding character.
@@ -51,8 +122,4 @@ class Mark:
         """
         if abs(value) > 1:
             raise ValueError("Value must be normalized to domain [-1.0, 1.0].")
-        if invert:
-            return self.get(1 - abs(value), False)
-        mark_chars = self._positive if value >= 0 else self._negative
-        mark_index = int(round(abs(value) * (len(mark_chars) - 1)))
-        return mark_chars[mark_index]
+        return self._glyphs[self.level(value, invert) + self._offset]
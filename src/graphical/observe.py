@@ -0,0 +1,110 @@
+"""Opt-in change tracking, so groups render only the children that changed.
+
+Renderables count their changes. Setting an observed attribute, such as the
+value of a ``Bar``, or appending to a renderable marks it and all groups it
+is part of as changed. After ``observe``, groups keep the rendered lines of
+each child and render a child again only if it changed since.
+
+Changes within data, such as setting an item of a list, are not tracked.
+Assign new data or call ``changed`` instead.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from rich.console import ConsoleOptions, RenderableType
+
+T = TypeVar("T")
+
+
+class Observable:
+    """Base of renderables that notify the groups they are part of about changes."""
+
+    _version = 0
+    _observers: Tuple["Observable", ...] = ()
+    # Rendered children by id, with their version and maximum width, None if not observed
+    _rendered: Optional[Dict[int, Tuple[Any, int, int, Any]]] = None
+
+    @property
+    def version(self) -> int:
+        """Number of changes of the renderable and its children."""
+        return self._version
+
+    def changed(self) -> None:
+        """Mark the renderable and the groups it is part of as changed."""
+        self._version += 1
+        for observer in self._observers:
+            observer.changed()
+
+    def _children(self) -> Iterable[RenderableType]:
+        """Renderables that are part of this renderable."""
+        return ()
+
+    def _observe_child(self, renderable: RenderableType) -> None:
+        """Observe a new child, if this renderable is observed."""
+        if self._rendered is not None:
+            _observe(renderable, self)
+
+    def _cached(
+        self,
+        renderable: RenderableType,
+        options: ConsoleOptions,
+        render: Callable[[], T],
+    ) -> T:
+        """Get the rendered child, rendered again if it changed since."""
+        rendered = self._rendered
+        if rendered is None or not isinstance(renderable, Observable):
+            return render()
+        entry = rendered.get(id(renderable))
+        version, width = renderable._version, options.max_width
+        if entry is None or entry[1] != version or entry[2] != width:
+            entry = rendered[id(renderable)] = (renderable, version, width, render())
+        return entry[3]
+
+
+class Observed:
+    """Attribute of an ``Observable``, that marks it as changed when it is set."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attribute = name
+        self._name = f"_{name}"
+
+    def __get__(self, instance: Optional[Observable], owner: type) -> Any:
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__[self._name]
+        except KeyError:
+            # Not set yet, so getattr with a default and hasattr work
+            raise AttributeError(self._attribute) from None
+
+    def __set__(self, instance: Observable, value: Any) -> None:
+        instance.__dict__[self._name] = value
+        instance.changed()
+
+
+def _observe(renderable: RenderableType, observer: Optional[Observable]) -> None:
+    if not isinstance(renderable, Observable):
+        return
+    if observer is not None and observer not in renderable._observers:
+        renderable._observers = (*renderable._observers, observer)
+    children: List[RenderableType] = list(renderable._children())
+    if children and renderable._rendered is None:
+        renderable._rendered = {}
+    for child in children:
+        _observe(child, renderable)
+
+
+def observe(renderable: T) -> T:
+    """Track changes of a renderable and its children.
+
+    Groups and layers keep the rendered lines of their children and reuse
+    them until a child changes. Children appended later are tracked too.
+
+    Args:
+        renderable (RenderableType): The renderable, usually a group.
+
+    Returns:
+        RenderableType: The same renderable.
+    """
+    _observe(renderable, None)
+    return renderable
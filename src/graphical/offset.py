@@ -1,9 +1,14 @@
+from typing import Iterable
+
 from rich.console import Console, ConsoleOptions, RenderResult, RenderableType
 from rich.measure import Measurement
 from rich.segment import Segment
 
+from graphical._measure import measure, render_scope
+from graphical.observe import Observable
+
 
-class Offset:
+class Offset(Observable):
     """Adds offset to renderable.
 
     Args:
@@ -22,10 +27,14 @@ class Offset:
         self._offset_x = x
         self._offset_y = y
 
+    def _children(self) -> Iterable[RenderableType]:
+        return [self._renderable]
+
     def __rich_measure__(
         self, console: Console, options: ConsoleOptions
     ) -> Measurement:
-        measurement = Measurement.get(console, options, self._renderable)
+        with render_scope():
+            measurement = measure(console, options, self._renderable)
         return Measurement(*(m + self._offset_x for m in measurement))
 
     def __rich_console__(
@@ -34,6 +43,8 @@ class Offset:
         new_line = Segment.line()
         for _ in range(self._offset_y):
             yield new_line
-        for line in console.render_lines(self._renderable, pad=False):
+        with render_scope():
+            lines = console.render_lines(self._renderable, pad=False)
+        for line in lines:
             yield " " * self._offset_x
             yield from line
@@ -0,0 +1,381 @@
+"""Render graphical renderables straight into strings with ANSI escape codes.
+
+The result is the same as printing to a terminal console of the given width
+and color system. Renderables are rendered without the casting and checks of
+``Console.render`` at each level, lines are cropped and encoded in one pass
+instead of being buffered, and escape codes are computed once per style and
+color system instead of once per segment.
+"""
+
+from io import StringIO
+from itertools import groupby
+from typing import Dict, Iterable, Iterator, List, Literal, NamedTuple, Optional, Tuple
+
+from rich.color import Color, ColorSystem
+from rich.console import Console, ConsoleOptions, RenderableType
+from rich.segment import Segment
+from rich.style import Style
+
+from graphical._segment import simplify
+from graphical.style import STYLES
+
+ColorSystemName = Literal["standard", "256", "truecolor", "windows"]
+
+COLOR_SYSTEMS: Dict[str, ColorSystem] = {
+    "standard": ColorSystem.STANDARD,
+    "256": ColorSystem.EIGHT_BIT,
+    "truecolor": ColorSystem.TRUECOLOR,
+    "windows": ColorSystem.WINDOWS,
+}
+
+Escape = Tuple[str, str]
+
+_escapes: Dict[ColorSystem, Dict[Style, Escape]] = {
+    color_system: {} for color_system in ColorSystem
+}
+# Number of styles after which the escape codes of a color system are
+# cleared, same as the default size of the style cache
+_ESCAPES_MAXSIZE = 4096
+
+
+def escape(style: Style, color_system: ColorSystem) -> Escape:
+    """Get the escape codes before and after text of a style.
+
+    Args:
+        style (Style): The style.
+        color_system (ColorSystem): The color system to render to.
+
+    Returns:
+        Tuple[str, str]: Escape codes before and after the text.
+    """
+    cache = _escapes[color_system]
+    codes = cache.get(style)
+    if codes is None:
+        if len(cache) >= _ESCAPES_MAXSIZE:
+            cache.clear()
+        codes = cache[style] = _escape(style, color_system)
+    return codes
+
+
+def _escape(style: Style, color_system: ColorSystem) -> Escape:
+    # Same codes as Style.render, which reuses the codes of the color system
+    # a style instance was first rendered to
+    sgr = [style.without_color._make_ansi_codes(color_system)]
+    if style.color is not None:
+        sgr += style.color.downgrade(color_system).get_ansi_codes()
+    if style.bgcolor is not None:
+        sgr += style.bgcolor.downgrade(color_system).get_ansi_codes(foreground=False)
+    attributes = ";".join(filter(None, sgr))
+    prefix, suffix = (f"\x1b[{attributes}m", "\x1b[0m") if attributes else ("", "")
+    if style.link:
+        prefix = f"\x1b]8;id={style.link_id};{style.link}\x1b\\{prefix}"
+        suffix = f"{suffix}\x1b]8;;\x1b\\"
+    return prefix, suffix
+
+
+def _segments(
+    renderable: RenderableType, console: Console, options: ConsoleOptions
+) -> Iterator[Segment]:
+    """Same segments as ``Console.render``, without casting and checks per call."""
+    method = getattr(renderable, "__rich_console__", None)
+    if method is None or isinstance(renderable, (str, type)):
+        yield from console.render(renderable, options)
+        return
+    if options.max_width < 1:
+        return
+    if options.height is not None:
+        options = options.reset_height()
+    for output in method(console, options):
+        if isinstance(output, Segment):
+            yield output
+        else:
+            yield from _segments(output, console, options)
+
+
+def _split(
+    segments: Iterable[Segment], width: int
+) -> Iterator[Tuple[List[Segment], bool]]:
+    """Split segments into lines cropped to width, same as ``Console.print``.
+
+    Yields:
+        Tuple[List[Segment], bool]: Segments of the line and whether it ends with a new line.
+    """
+    line: List[Segment] = []
+    get_line_length = Segment.get_line_length
+    for segment in segments:
+        text = segment.text
+        if "\n" in text and not segment.control:
+            style = segment.style
+            while text:
+                _text, new_line, text = text.partition("\n")
+                if _text:
+                    line.append(Segment(_text, style))
+                if new_line:
+                    if get_line_length(line) > width:
+                        line = Segment.adjust_line_length(line, width, pad=False)
+                    yield line, True
+                    line = []
+        else:
+            line.append(segment)
+    if line:
+        if get_line_length(line) > width:
+            line = Segment.adjust_line_length(line, width, pad=False)
+        yield line, False
+
+
+def _encode_line(
+    line: Iterable[Segment], cache: Dict[Style, Escape], color_system: ColorSystem
+) -> Iterator[str]:
+    for text, style, _ in line:
+        if not style:
+            yield text
+        elif text:
+            prefix, suffix = cache.get(style) or escape(style, color_system)
+            yield prefix
+            yield text
+            yield suffix
+
+
+def encode(
+    segments: Iterable[Segment],
+    width: int,
+    color_system: ColorSystem,
+    optimize: bool = False,
+) -> str:
+    """Encode segments as text with escape codes, cropping lines to width.
+
+    Args:
+        segments (Iterable[Segment]): Segments of the lines, separated by new lines.
+        width (int): Maximum cell length of each line.
+        color_system (ColorSystem): The color system to render to.
+        optimize (bool, optional): Minimize escape codes of each line with ``optimize``. Defaults to False.
+
+    Returns:
+        str: The encoded text.
+    """
+    cache = _escapes[color_system]
+    output: List[str] = []
+    extend = output.extend
+    for line, new_line in _split(segments, width):
+        if optimize:
+            line = _optimize_line(line, color_system)
+        extend(_encode_line(line, cache, color_system))
+        if new_line:
+            output.append("\n")
+    return "".join(output)
+
+
+COMPLEMENTS: Dict[str, str] = {
+    "\u258c": "\u2590",
+    "\u2590": "\u258c",
+    "\u2580": "\u2584",
+    "\u2584": "\u2580",
+}
+"""Glyphs that look the same as their complement with swapped colors."""
+
+FULL = "\u2588"
+BLANK = " "
+
+
+class OptimizedLines(NamedTuple):
+    """Lines with minimized escape codes.
+
+    Args:
+        lines (List[List[Segment]]): Optimized lines.
+        saved (int): Number of bytes saved by encoding the optimized lines instead of the original lines.
+    """
+
+    lines: List[List[Segment]]
+    saved: int
+
+
+# A unit is a concrete choice of text and style, or a blank or full cell
+# that only requires the background ("bg") or foreground ("fg") of its style
+# to be a given color and can share the style of a neighbour.
+_Choice = Tuple[str, Optional[Style]]
+_Free = Tuple[str, str, Optional[Color], Optional[Style]]
+
+
+def _color(color: Optional[Color]) -> Optional[Color]:
+    return None if color is None or color.is_default else color
+
+
+def _plain(style: Optional[Style]) -> bool:
+    """Style has no attributes other than color and background color."""
+    if style is None:
+        return True
+    return style == STYLES.get(style.color, style.bgcolor)
+
+
+def _units(
+    line: List[Segment], plain: Dict[Optional[Style], bool]
+) -> Iterator[Tuple[List[_Choice], List[_Free]]]:
+    """Split a line into units with their alternatives."""
+    for segment in line:
+        text, style, control = segment
+        if style not in plain:
+            plain[style] = _plain(style)
+        if control or not plain[style]:
+            yield [(text, style)], []
+            continue
+        fg = _color(style.color) if style else None
+        bg = _color(style.bgcolor) if style else None
+        fixed = ""
+        for char, group in groupby(text):
+            # Identical cells of a run take the same alternative
+            cells = char * len(list(group))
+            if char not in COMPLEMENTS and char != BLANK and char != FULL:
+                fixed += cells
+                continue
+            if fixed:
+                yield [(fixed, style)], []
+                fixed = ""
+            choices: List[_Choice] = [(cells, style)]
+            free: List[_Free] = []
+            if char in COMPLEMENTS:
+                if fg is not None and bg is not None:
+                    choices.append((COMPLEMENTS[char] * len(cells), STYLES.get(bg, fg)))
+            elif char == BLANK:
+                free.append((cells, "bg", bg, style))
+                if bg is not None:
+                    free.append((FULL * len(cells), "fg", bg, STYLES.get(bg)))
+            else:
+                free.append((cells, "fg", fg, style))
+                if fg is not None:
+                    free.append((BLANK * len(cells), "bg", fg, STYLES.get(None, fg)))
+            yield choices, free
+        if fixed:
+            yield [(fixed, style)], []
+
+
+def _optimize_line(line: List[Segment], color_system: ColorSystem) -> List[Segment]:
+    """Choose glyphs and styles of a line with the least bytes of escape codes and text."""
+    plain: Dict[Optional[Style], bool] = {None: True}
+    units = list(_units(line, plain))
+    if not units:
+        return line
+    sizes: Dict[Optional[Style], int] = {None: 0}
+
+    def size(style: Optional[Style]) -> int:
+        if style not in sizes:
+            prefix, suffix = escape(style, color_system) if style else ("", "")
+            sizes[style] = len(prefix) + len(suffix)
+        return sizes[style]
+
+    def matches(style: Optional[Style], kind: str, color: Optional[Color]) -> bool:
+        if style not in plain:
+            plain[style] = _plain(style)
+        if not plain[style]:
+            return False
+        if style is None:
+            return color is None
+        return _color(style.color if kind == "fg" else style.bgcolor) == color
+
+    # Styles a unit can take, so free units can take the style of the next unit
+    ahead: List[List[Optional[Style]]] = [[] for _ in units]
+    following: List[Optional[Style]] = []
+    for idx in range(len(units) - 1, -1, -1):
+        choices, free = units[idx]
+        styles = [style for _, style in choices]
+        for _, kind, color, fallback in free:
+            styles.append(fallback)
+            styles += [d for d in following if matches(d, kind, color)]
+        ahead[idx] = following = list(dict.fromkeys(styles))[:8]
+
+    # Least bytes of each style of the last unit, with a back reference
+    Entry = Tuple[int, Optional[Style], str]
+    tables: List[Dict[Optional[Style], Entry]] = []
+    previous: Dict[Optional[Style], int] = {None: 0}
+    for idx, (choices, free) in enumerate(units):
+        table: Dict[Optional[Style], Entry] = {}
+
+        def add(cost: int, state: Optional[Style], back: Optional[Style], text: str):
+            entry = table.get(state)
+            if entry is None or cost < entry[0]:
+                table[state] = (cost, back, text)
+
+        for back, cost in previous.items():
+            for text, style in choices:
+                extra = 0 if style == back else size(style)
+                add(cost + len(text.encode()) + extra, style, back, text)
+            for text, kind, color, fallback in free:
+                cost_text = cost + len(text.encode())
+                if matches(back, kind, color):
+                    add(cost_text, back, back, text)
+                    continue
+                add(cost_text + size(fallback), fallback, back, text)
+                for style in ahead[idx]:
+                    if matches(style, kind, color):
+                        add(cost_text + size(style), style, back, text)
+        tables.append(table)
+        previous = {state: entry[0] for state, entry in table.items()}
+
+    state = min(previous, key=lambda d: previous[d])
+    cells: List[Segment] = []
+    for table in reversed(tables):
+        _, back, text = table[state]
+        cells.append(Segment(text, state))
+        state = back
+    return list(simplify(reversed(cells)))
+
+
+def optimize(
+    lines: Iterable[List[Segment]], color_system: ColorSystemName = "truecolor"
+) -> OptimizedLines:
+    """Minimize the escape codes of rendered lines, without changing how they look.
+
+    Blank and full cells, and half blocks and their complements, are replaced
+    by the glyph and colors, that continue the style of their neighbours, so
+    runs of cells with the same style get longer. Only cells with color and
+    background color, but no other attributes, are replaced.
+
+    Args:
+        lines (Iterable[List[Segment]]): Rendered lines, for example from ``Console.render_lines``.
+        color_system (ColorSystemName, optional): Color system of the escape codes. Defaults to "truecolor".
+
+    Returns:
+        OptimizedLines: Optimized lines and number of bytes saved.
+    """
+    system = COLOR_SYSTEMS[color_system]
+    cache = _escapes[system]
+    result: List[List[Segment]] = []
+    saved = 0
+    for line in lines:
+        optimized = _optimize_line(line, system)
+        saved += len("".join(_encode_line(line, cache, system)).encode())
+        saved -= len("".join(_encode_line(optimized, cache, system)).encode())
+        result.append(optimized)
+    return OptimizedLines(result, saved)
+
+
+def render(
+    renderable: RenderableType,
+    *,
+    width: int = 80,
+    color_system: ColorSystemName = "truecolor",
+    optimize: bool = False,
+) -> str:
+    """Render a renderable into a string with ANSI escape codes.
+
+    Args:
+        renderable (RenderableType): The renderable, usually a graphical renderable or group.
+        width (int, optional): Width of the output in cells. Defaults to 80.
+        color_system (ColorSystemName, optional): Color system of the escape codes ("standard", "256", "truecolor" or "windows"). Defaults to "truecolor".
+        optimize (bool, optional): Minimize escape codes of each line, see ``optimize``. The output looks the same, but differs from printing. Defaults to False.
+
+    Returns:
+        str: Same output as printing the renderable to a terminal console.
+    """
+    console = Console(
+        file=StringIO(),
+        width=width,
+        color_system=color_system,
+        force_terminal=True,
+        legacy_windows=False,
+    )
+    return encode(
+        _segments(renderable, console, console.options),
+        width,
+        COLOR_SYSTEMS[color_system],
+        optimize,
+    )
@@ -0,0 +1,15 @@
+from ._scale import Grid, LinearScale, LogScale, Scale, ValueRange, as_scale
+from ._time import INTERVALS, Interval, TimeScale, TimeUnit
+
+__all__ = [
+    "as_scale",
+    "Grid",
+    "Interval",
+    "INTERVALS",
+    "LinearScale",
+    "LogScale",
+    "Scale",
+    "TimeScale",
+    "TimeUnit",
+    "ValueRange",
+]
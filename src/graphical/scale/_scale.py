@@ -0,0 +1,187 @@
+import math
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, Hashable, NamedTuple, Sequence, Tuple, Union
+
+
+class Grid(NamedTuple):
+    """Cell boundaries of a scale for a number of cells.
+
+    Args:
+        boundaries (Tuple[float, ...]): Values of the cell boundaries in ascending order, one more than cells.
+        positions (Tuple[float, ...]): Positions of the boundaries on the scale, evenly spaced.
+    """
+
+    boundaries: Tuple[float, ...]
+    positions: Tuple[float, ...]
+
+
+class Scale:
+    """Maps values of a domain to cells.
+
+    The cell boundaries are computed once per number of cells and shared
+    between all marks that use the scale.
+
+    Args:
+        domain (Tuple[float, float]): Lower and upper boundary.
+    """
+
+    def __init__(self, domain: Tuple[float, float]) -> None:
+        lower, upper = domain
+        self._domain = (lower, upper)
+        self._grids: Dict[int, Grid] = {}
+
+    @property
+    def domain(self) -> Tuple[float, float]:
+        """Lower and upper boundary."""
+        return self._domain
+
+    def transform(self, value: float) -> float:
+        """Get the position of a value on the scale."""
+        raise NotImplementedError
+
+    def _grid(self, length: int) -> Grid:
+        raise NotImplementedError
+
+    def grid(self, length: int) -> Grid:
+        """Get the cell boundaries for a number of cells.
+
+        Args:
+            length (int): Number of cells.
+
+        Returns:
+            Grid: Values and positions of the cell boundaries.
+        """
+        grid = self._grids.get(length)
+        if grid is None:
+            grid = self._grids[length] = self._grid(length)
+        return grid
+
+    def span(self, lower: float, upper: float, length: int) -> Tuple[int, int]:
+        """Get the number of whole cells below and above a section of the domain.
+
+        Args:
+            lower (float): Lower boundary of the section.
+            upper (float): Upper boundary of the section.
+            length (int): Number of cells.
+
+        Returns:
+            Tuple[int, int]: Number of cells below and above the section.
+        """
+        boundaries = self.grid(length).boundaries
+        inset = min(max(bisect_right(boundaries, lower) - 1, 0), length)
+        trail = max(length - bisect_left(boundaries, upper), 0)
+        return inset, trail
+
+    def _key(self) -> Tuple[Hashable, ...]:
+        return (type(self), self._domain)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Scale):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._domain})"
+
+
+class LinearScale(Scale):
+    """Maps values of a domain linearly to cells.
+
+    Args:
+        domain (Tuple[float, float]): Lower and upper boundary.
+    """
+
+    def transform(self, value: float) -> float:
+        return value
+
+    def _grid(self, length: int) -> Grid:
+        lower, upper = self._domain
+        step = abs(upper - lower) / length
+        # Same arithmetic as Section.segment for identical cell boundaries, the
+        # last boundary is the upper boundary, so the maximum is in the last cell
+        boundaries = tuple([lower + idx * step for idx in range(length)] + [upper])
+        return Grid(boundaries, boundaries)
+
+    def span(self, lower: float, upper: float, length: int) -> Tuple[int, int]:
+        domain_lower, domain_upper = self._domain
+        step = abs(domain_upper - domain_lower) / length
+        inset = max(int((lower - domain_lower) // step), 0)
+        trail = max(int((domain_upper - upper) // step), 0)
+        return inset, trail
+
+
+class LogScale(Scale):
+    """Maps values of a domain logarithmically to cells.
+
+    Each cell spans the same ratio of values. Values outside of the domain are
+    clamped to the domain, so bars with the default origin start at the lower
+    boundary.
+
+    Args:
+        domain (Tuple[float, float]): Lower and upper boundary, both positive.
+        base (float, optional): Base of the logarithm. Defaults to 10.
+
+    Raises:
+        ValueError: Domain must be positive.
+    """
+
+    def __init__(self, domain: Tuple[float, float], base: float = 10) -> None:
+        super().__init__(domain)
+        lower, upper = self._domain
+        if lower <= 0 or upper <= 0:
+            raise ValueError("Domain of a log scale must be positive.")
+        self._base = base
+        self._positions = (math.log(lower, base), math.log(upper, base))
+
+    @property
+    def base(self) -> float:
+        """Base of the logarithm."""
+        return self._base
+
+    def transform(self, value: float) -> float:
+        lower, upper = self._domain
+        return math.log(min(max(value, lower), upper), self._base)
+
+    def _grid(self, length: int) -> Grid:
+        lower, upper = self._domain
+        start, end = self._positions
+        step = (end - start) / length
+        positions = [start + idx * step for idx in range(length)] + [end]
+        boundaries = [lower] + [self._base**d for d in positions[1:-1]] + [upper]
+        return Grid(tuple(boundaries), tuple(positions))
+
+    def _key(self) -> Tuple[Hashable, ...]:
+        return (*super()._key(), self._base)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._domain}, base={self._base})"
+
+
+ValueRange = Union[Tuple[float, float], Scale]
+
+
+@lru_cache(maxsize=256)
+def _linear(domain: Tuple[float, float]) -> LinearScale:
+    return LinearScale(domain)
+
+
+def as_scale(value_range: Union[Sequence[float], Scale]) -> Scale:
+    """Get the scale of a value range.
+
+    Linear scales of equal value ranges are shared, so marks that are given
+    the same lower and upper boundary share their cell boundaries too.
+
+    Args:
+        value_range (Union[Tuple[float, float], Scale]): Scale, or lower and upper boundary of a linear scale.
+
+    Returns:
+        Scale: The scale.
+    """
+    if isinstance(value_range, Scale):
+        return value_range
+    lower, upper = value_range
+    return _linear((lower, upper))
@@ -0,0 +1,261 @@
+from bisect import bisect_right
+from functools import partial
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from graphical import _numpy
+from graphical.data._bins import _KERNELS, SummaryFunction, SummaryKernel
+
+from ._scale import LinearScale
+
+TimeUnit = Literal["second", "minute", "hour", "day", "week", "month"]
+
+SECOND = 1_000_000_000
+MINUTE = 60 * SECOND
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+WEEK = 7 * DAY
+
+_NANOSECONDS: Dict[str, int] = {
+    "second": SECOND,
+    "minute": MINUTE,
+    "hour": HOUR,
+    "day": DAY,
+    "week": WEEK,
+    # Average length of a month in the Gregorian calendar
+    "month": 2_629_746 * SECOND,
+}
+# Weeks start on Monday, 1970-01-05
+_MONDAY = 4 * DAY
+
+
+class Interval(NamedTuple):
+    """Size of a time bucket, a number of time units.
+
+    Args:
+        count (int): Number of units.
+        unit (TimeUnit): Time unit ("second", "minute", "hour", "day", "week" or "month").
+    """
+
+    count: int
+    unit: TimeUnit
+
+    @property
+    def nanoseconds(self) -> int:
+        """Length in nanoseconds, the average length for months."""
+        return self.count * _NANOSECONDS[self.unit]
+
+
+INTERVALS: Tuple[Interval, ...] = (
+    *(Interval(d, "second") for d in (1, 2, 5, 10, 15, 30)),
+    *(Interval(d, "minute") for d in (1, 2, 5, 10, 15, 30)),
+    *(Interval(d, "hour") for d in (1, 2, 3, 6, 12)),
+    Interval(1, "day"),
+    Interval(1, "week"),
+    *(Interval(d, "month") for d in (1, 3, 6, 12)),
+)
+"""Nice bucket sizes in ascending order."""
+
+
+def _months(timestamp: int) -> int:
+    """Months since 1970-01 of epoch nanoseconds, in UTC."""
+    # Civil from days, with years starting in March
+    days = timestamp // DAY + 719_468
+    era = days // 146_097
+    day_of_era = days - era * 146_097
+    year_of_era = (
+        day_of_era - day_of_era // 1_460 + day_of_era // 36_524 - day_of_era // 146_096
+    ) // 365
+    day_of_year = day_of_era - (
+        365 * year_of_era + year_of_era // 4 - year_of_era // 100
+    )
+    # Months since March, shifted by two to months since January of the year
+    month = (5 * day_of_year + 2) // 153
+    return (era * 400 + year_of_era - 1970) * 12 + month + 2
+
+
+def _month_start(months: int) -> int:
+    """Epoch nanoseconds of the start of a month since 1970-01, in UTC."""
+    year, month = 1970 + months // 12, months % 12 + 1
+    # Days from civil
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month - 3 if month > 2 else month + 9) + 2) // 5
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return (era * 146_097 + day_of_era - 719_468) * DAY
+
+
+class TimeScale(LinearScale):
+    """Maps epoch nanoseconds to cells and buckets events by calendar-aware intervals.
+
+    Timestamps are integers of nanoseconds since 1970-01-01 in UTC. Cells of
+    marks are linear in time. Events are bucketed by nice intervals, from
+    seconds to months, with integer arithmetic only, so no ``datetime`` is
+    created per event. Buckets are aligned to whole units since the epoch,
+    weeks start on Monday and months on the first day of the month.
+
+    Args:
+        domain (Tuple[int, int]): Start and end of the time range, the end is exclusive.
+        interval (Interval, optional): Fixed bucket size. Defaults to the smallest nice interval, that fits the time range into the number of cells.
+    """
+
+    def __init__(
+        self, domain: Tuple[int, int], *, interval: Optional[Interval] = None
+    ) -> None:
+        super().__init__(domain)
+        self._interval = interval
+
+    def interval(self, length: int) -> Interval:
+        """Get the bucket size for a number of cells.
+
+        Args:
+            length (int): Maximum number of buckets.
+
+        Returns:
+            Interval: The fixed interval, or the smallest nice interval with at most ``length`` buckets.
+        """
+        if self._interval is not None:
+            return self._interval
+        for interval in INTERVALS:
+            if self._count(interval) <= length:
+                return interval
+        return INTERVALS[-1]
+
+    def _index(self, timestamp: int, interval: Interval) -> int:
+        """Index of the bucket of a timestamp since the epoch."""
+        count, unit = interval
+        if unit == "month":
+            return _months(timestamp) // count
+        if unit == "week":
+            return (timestamp - _MONDAY) // (count * WEEK)
+        return timestamp // interval.nanoseconds
+
+    def _count(self, interval: Interval) -> int:
+        start, end = self._domain
+        return (
+            self._index(max(end - 1, start), interval)
+            - self._index(start, interval)
+            + 1
+        )
+
+    def buckets(self, length: int) -> List[int]:
+        """Get the boundaries of the buckets for a number of cells.
+
+        Args:
+            length (int): Maximum number of buckets.
+
+        Returns:
+            List[int]: Start of each bucket and end of the last bucket, in epoch nanoseconds.
+        """
+        interval = self.interval(length)
+        first = self._index(self._domain[0], interval)
+        indices = range(first, first + self._count(interval) + 1)
+        count, unit = interval
+        if unit == "month":
+            return [_month_start(idx * count) for idx in indices]
+        offset = _MONDAY if unit == "week" else 0
+        return [idx * interval.nanoseconds + offset for idx in indices]
+
+    def bins(
+        self,
+        timestamps: Sequence[int],
+        values: Optional[Sequence[float]] = None,
+        *,
+        length: int,
+        summary_function: Union[SummaryFunction, SummaryKernel] = "count",
+    ) -> List[float]:
+        """Summarize events in the buckets for a number of cells, same as ``bins``.
+
+        Events outside of the time range are skipped. Events need not be
+        sorted. For NumPy arrays, the kernels "count", "sum", "mean", "min"
+        and "max" are vectorized. Buckets without events are summarized as
+        NaN, except for "count" and "sum".
+
+        Args:
+            timestamps (Sequence[int]): Times of the events in epoch nanoseconds.
+            values (Sequence[float], optional): Values of the events. Defaults to 1 per event.
+            length (int): Maximum number of buckets.
+            summary_function (Union[SummaryFunction, SummaryKernel]): Function or name of kernel to summarize the values in each bucket. Defaults to "count".
+
+        Returns:
+            List[float]: Summary of each bucket, see ``buckets``.
+        """
+        if isinstance(summary_function, str) and summary_function not in _KERNELS:
+            raise ValueError(f"Unknown summary kernel {summary_function!r}.")
+        boundaries = self.buckets(length)
+        count = len(boundaries) - 1
+        start, end = self._domain
+        if _numpy.is_array(timestamps):
+            result = _bins_numpy(
+                timestamps, values, boundaries, start, end, summary_function
+            )
+            if result is not None:
+                return result
+            timestamps = timestamps.tolist()
+        # Buckets of events are found by bisecting the integer bucket boundaries
+        locate = partial(bisect_right, boundaries)
+        if values is None and summary_function == "count":
+            counts = [0] * count
+            for timestamp in timestamps:
+                if start <= timestamp < end:
+                    counts[locate(timestamp) - 1] += 1
+            return counts
+        groups: List[List[float]] = [[] for _ in range(count)]
+        events = zip(timestamps, [1] * len(timestamps) if values is None else values)
+        for timestamp, value in events:
+            if start <= timestamp < end:
+                groups[locate(timestamp) - 1].append(value)
+        if not isinstance(summary_function, str):
+            return [summary_function(group) for group in groups]
+        kernel = _KERNELS[summary_function]
+        return [kernel(iter(group), len(group)) for group in groups]
+
+    def _key(self) -> Tuple[Any, ...]:
+        return (*super()._key(), self._interval)
+
+
+def _bins_numpy(
+    timestamps,
+    values,
+    boundaries: List[int],
+    start: int,
+    end: int,
+    summary_function: Union[SummaryFunction, SummaryKernel],
+) -> Optional[List[float]]:
+    if summary_function not in ("count", "sum", "mean", "min", "max"):
+        return None
+    np = _numpy.numpy
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    count = len(boundaries) - 1
+    inside = (timestamps >= start) & (timestamps < end)
+    indices = np.searchsorted(boundaries, timestamps[inside], side="right") - 1
+    counts = np.bincount(indices, minlength=count)
+    if summary_function == "count":
+        return counts.tolist()
+    if values is None:
+        weights = np.ones(len(indices))
+    else:
+        weights = np.asarray(values, dtype=np.float64)[inside]
+    if summary_function in ("sum", "mean"):
+        result = np.bincount(indices, weights=weights, minlength=count)
+        if summary_function == "mean":
+            with np.errstate(invalid="ignore"):
+                result = result / counts
+    else:
+        ufunc, fill = (
+            (np.minimum, np.inf) if summary_function == "min" else (np.maximum, -np.inf)
+        )
+        result = np.full(count, fill)
+        ufunc.at(result, indices, weights)
+        result[counts == 0] = np.nan
+    return result.tolist()
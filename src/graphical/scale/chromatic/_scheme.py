@@ -1,8 +1,19 @@
-from functools import lru_cache
 from math import floor
-from typing import List, Protocol
+from typing import Any, Iterable, List, Optional, Protocol, Tuple
 from rich.color import Color
 
+from graphical import _numpy
+
+
+def _rgb(colors: List[Color]) -> Any:
+    """Pack colors into an N×3 uint8 array, with an additional black entry for missing values."""
+    triplets = [c.get_truecolor() for c in colors] + [(0, 0, 0)]
+    return _numpy.numpy.array(triplets, dtype=_numpy.numpy.uint8)
+
+
+def _missing(value: Optional[float]) -> bool:
+    return value is None or value != value
+
 
 def _spline(t: float, p0: float, p1: float, p2: float, p3: float) -> float:
     """Calculates a cubic B-spline point for a given t [0, 1]."""
@@ -43,28 +54,128 @@ class Scheme(Protocol):
 class SequentialScheme:
     """Sequential color scheme.
 
+    Colors are looked up in a table of ``resolution`` precomputed colors,
+    which is created on first use.
+
     Args:
         *colors (str): Colors in scheme.
         closed (bool, optional): Interpolate cyclical. Defaults to False.
+        resolution (int, optional): Number of colors in the lookup table. Defaults to 256.
     """
 
     def __init__(
         self,
         *colors: str,
         closed: bool = False,
+        resolution: int = 256,
     ) -> None:
         self._colors = [Color.parse(c) for c in colors]
         self._closed = closed
+        self._channels = list(zip(*(c.get_truecolor() for c in self._colors)))
+        self._resolution = resolution
+        self._table: Optional[List[Color]] = None
+        self._rgb_table: Any = None
 
-    @lru_cache()
-    def get(self, value: float) -> Color:
-        """Get color for value."""
+    @property
+    def resolution(self) -> int:
+        """Number of colors in the lookup table."""
+        return self._resolution
+
+    @resolution.setter
+    def resolution(self, resolution: int) -> None:
+        self._resolution = resolution
+        self._table = None
+        self._rgb_table = None
+
+    def _exact(self, value: float) -> Color:
         interpolate = _interpolate_closed if self._closed else _interpolate
-        triplets = [[*c.get_truecolor()] for c in self._colors]
-        channels = zip(*triplets)
-        rgb_value = [interpolate(value, *channel) for channel in channels]
+        rgb_value = [interpolate(value, *channel) for channel in self._channels]
         return Color.from_rgb(*rgb_value)
 
+    def _lookup_table(self) -> List[Color]:
+        if self._table is None:
+            scale = self._resolution - 1
+            self._table = [self._exact(d / scale) for d in range(self._resolution)]
+        return self._table
+
+    def get(self, value: float, exact: bool = False) -> Color:
+        """Get color for value.
+
+        Args:
+            value (float): Value in the domain [0, 1].
+            exact (bool, optional): Interpolate color instead of using the lookup table. Defaults to False.
+
+        Returns:
+            Color: Color for value.
+        """
+        if exact or not 0.0 <= value <= 1.0:
+            return self._exact(value)
+        table = self._table or self._lookup_table()
+        return table[int(value * (self._resolution - 1) + 0.5)]
+
+    def indices(
+        self,
+        values: Iterable[Optional[float]],
+        value_range: Optional[Tuple[float, float]] = None,
+    ) -> Any:
+        """Map values to indices of the lookup table in one call.
+
+        Values are clipped to the domain [0, 1] after normalization. Missing values
+        (None or NaN) are mapped to -1. Uses NumPy if installed, arrays keep their shape.
+
+        Args:
+            values (Iterable[Optional[float]]): Values in the domain [0, 1] or ``value_range``.
+            value_range (Tuple[float, float], optional): Normalize values from range.
+
+        Returns:
+            Indices as int array, or as list if NumPy is not installed.
+        """
+        scale = self._resolution - 1
+        lower, upper = value_range or (0.0, 1.0)
+        span = upper - lower
+        np = _numpy.numpy
+        if np is not None:
+            data = (np.asarray(values, dtype=np.float64) - lower) / span
+            missing = np.isnan(data)
+            data = np.clip(np.where(missing, 0.0, data), 0.0, 1.0)
+            result = (data * scale + 0.5).astype(np.intp)
+            result[missing] = -1
+            return result
+        return [
+            -1
+            if _missing(value)
+            else int(min(max((value - lower) / span, 0.0), 1.0) * scale + 0.5)
+            for value in values
+        ]
+
+    def map(
+        self,
+        values: Iterable[Optional[float]],
+        value_range: Optional[Tuple[float, float]] = None,
+    ) -> Any:
+        """Map values to RGB colors in one call, see ``indices``.
+
+        Missing values are mapped to black.
+
+        Returns:
+            RGB colors as N×3 uint8 array, or as list of triplets if NumPy is not installed.
+        """
+        indices = self.indices(values, value_range)
+        if _numpy.numpy is not None:
+            if self._rgb_table is None:
+                self._rgb_table = _rgb(self._lookup_table())
+            return self._rgb_table[indices]
+        table = self._lookup_table()
+        return [
+            (0, 0, 0) if idx < 0 else tuple(table[idx].get_truecolor())
+            for idx in indices
+        ]
+
+    @property
+    def table(self) -> List[Color]:
+        """Return colors of the lookup table."""
+        return self._lookup_table()[:]
+
     @property
     def colors(self) -> List[Color]:
         """Return colors in scheme."""
@@ -72,7 +183,7 @@ class SequentialScheme:
 
     def palette(self, n: int) -> List[Color]:
         """Sample scheme for palette of `n` colors."""
-        return [self.get(d / (n - 1)) for d in range(n)]
+        return [self.get(d / (n - 1), exact=True) for d in range(n)]
 
 
 class OrdinalScheme:
@@ -90,16 +201,60 @@ class OrdinalScheme:
     ) -> None:
         self._colors = [Color.parse(c) for c in colors]
         self._closed = closed
+        self._rgb_table: Any = None
 
-    @lru_cache(64)
-    def get(self, value: float) -> Color:
-        """Get color for value."""
+    def _index(self, value: float) -> int:
         value = int(value)
         if self._closed:
-            value = max(0, min(len(self._colors) - 1, value))
-        else:
-            value = value % (len(self._colors) - 1)
-        return self._colors[value]
+            return max(0, min(len(self._colors) - 1, value))
+        return value % (len(self._colors) - 1)
+
+    def get(self, value: float) -> Color:
+        """Get color for value."""
+        return self._colors[self._index(value)]
+
+    def indices(self, values: Iterable[Optional[float]]) -> Any:
+        """Map values to indices of the scheme colors in one call.
+
+        Missing values (None or NaN) are mapped to -1. Uses NumPy if installed,
+        arrays keep their shape.
+
+        Args:
+            values (Iterable[Optional[float]]): Values.
+
+        Returns:
+            Indices as int array, or as list if NumPy is not installed.
+        """
+        np = _numpy.numpy
+        if np is not None:
+            data = np.asarray(values, dtype=np.float64)
+            missing = np.isnan(data)
+            result = np.where(missing, 0.0, data).astype(np.intp)
+            if self._closed:
+                result = np.clip(result, 0, len(self._colors) - 1)
+            else:
+                result = result % (len(self._colors) - 1)
+            result[missing] = -1
+            return result
+        return [-1 if _missing(value) else self._index(value) for value in values]
+
+    def map(self, values: Iterable[Optional[float]]) -> Any:
+        """Map values to RGB colors in one call, see ``indices``.
+
+        Missing values are mapped to black.
+
+        Returns:
+            RGB colors as N×3 uint8 array, or as list of triplets if NumPy is not installed.
+        """
+        indices = self.indices(values)
+        if _numpy.numpy is not None:
+            if self._rgb_table is None:
+                self._rgb_table = _rgb(self._colors)
+            return self._rgb_table[indices]
+        return [
+            (0, 0, 0) if idx < 0 else tuple(self._colors[idx].get_truecolor())
+            for idx in indices
+        ]
 
     @property
     def colors(self) -> List[Color]:
@@ -0,0 +1,126 @@
+from collections import deque
+from typing import Deque, Iterable, List, Optional, Tuple, Union
+
+from rich.color import Color
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.measure import Measurement
+from rich.segment import Segment
+
+from graphical.bar import Bar
+from graphical.data import SummaryFunction, SummaryKernel, bins
+from graphical._segment import simplify
+from graphical.mark import Mark
+from graphical.mark.vertical import BAR_BLOCK_V
+from graphical.observe import Observable
+from graphical.scale import ValueRange, as_scale
+from graphical.style import STYLES
+
+
+class Sparkline(Observable):
+    """Single line bar graph of the latest values of a series.
+
+    Values are kept in a ring buffer of fixed capacity. Each appended value is
+    rendered to a cell once and the line scrolls to the left. If the capacity
+    exceeds the width, the values are resampled with ``bins`` instead.
+
+    Args:
+        data (Iterable[float]): The initial values.
+        value_range (Union[Tuple[float, float], Scale]): Lower and upper boundary, or scale.
+        width (int, optional): The width of the graph. Defaults to 25.
+        capacity (int, optional): Number of values kept. Defaults to width.
+        marks (Mark, optional): Marks used for the bars. Defaults to "block".
+        color (Union[Color, str], optional): Color of the bars. Defaults to "default".
+        bgcolor (Union[Color, str], optional): Background color. Defaults to "default".
+        summary_function (Union[SummaryFunction, SummaryKernel]): Function or name of kernel to resample the values. Defaults to "mean".
+    """
+
+    def __init__(
+        self,
+        data: Iterable[float],
+        value_range: ValueRange,
+        *,
+        width: Optional[int] = None,
+        capacity: Optional[int] = None,
+        marks: Optional[Mark] = None,
+        color: Optional[Union[Color, str]] = None,
+        bgcolor: Optional[Union[Color, str]] = None,
+        summary_function: Union[SummaryFunction, SummaryKernel] = "mean",
+    ) -> None:
+        self.width = width or 25
+        self.capacity = capacity or self.width
+        self.summary_function = summary_function
+        self._bar = Bar(
+            0.0,
+            value_range,
+            length=1,
+            marks=marks or BAR_BLOCK_V,
+            color=color,
+            bgcolor=bgcolor,
+            orientation="vertical",
+            origin=as_scale(value_range).domain[0],
+            prefer_bg="never",
+        )
+        self._blank = Segment(" ", style=STYLES.get(bgcolor=bgcolor))
+        self._values: Deque[float] = deque(maxlen=self.capacity)
+        self._cells: Deque[Segment] = deque(maxlen=self.capacity)
+        self._line: Optional[List[Segment]] = None
+        self.extend(data)
+
+    @property
+    def values(self) -> List[float]:
+        """Return values in buffer, oldest first."""
+        return list(self._values)
+
+    def _cell(self, value: float) -> Segment:
+        self._bar.value = value
+        return next(iter(self._bar.segments(1)))
+
+    def append(self, value: float) -> None:
+        """Append value and drop the oldest value if the buffer is full."""
+        self._values.append(value)
+        if self.capacity <= self.width:
+            self._cells.append(self._cell(value))
+        self._line = None
+        self.changed()
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Append multiple values."""
+        for value in values:
+            self.append(value)
+
+    def line(self) -> List[Segment]:
+        """Returns the rendered line, right aligned.
+
+        Returns:
+            List[Segment]: Simplified segments of the line.
+        """
+        if self._line is None:
+            if self.capacity <= self.width:
+                cells = list(self._cells)
+            elif len(self._values) <= self.width:
+                cells = [self._cell(d) for d in self._values]
+            else:
+                binned = bins(
+                    list(self._values),
+                    self.width,
+                    summary_function=self.summary_function,
+                )
+                cells = [self._cell(d) for d in binned]
+            padding = [self._blank] * (self.width - len(cells))
+            self._line = list(simplify([*padding, *cells]))
+        return self._line
+
+    def __graphical_size__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Optional[Tuple[int, int]]:
+        return self.width, 1
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        yield from self.line()
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        return Measurement(self.width, self.width)
@@ -0,0 +1,179 @@
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+from rich.color import Color, ColorSystem
+from rich.style import Style
+
+from graphical.options import InversionStrategy
+
+ColorType = Union[Color, str]
+
+
+def invert_style(style: Style, strategy: Optional[InversionStrategy] = "swap") -> Style:
+    """Invert a Rich Style by swapping its foreground and background colors.
+
+    Args:
+        style (Style): The original style to invert.
+    Returns:
+        Style: The inverted style.
+    """
+    if strategy == "swap":
+        return style + Style(color=style.bgcolor, bgcolor=style.color)
+    if strategy == "reverse":
+        return style + Style(reverse=True)
+    return style
+
+
+class SharedStyle(Style):
+    """Style that is shared between consoles, with ANSI codes cached per color system.
+
+    ``Style`` caches its ANSI codes for the color system it is first rendered
+    to and reuses them for every other color system. Interned styles are
+    printed to consoles with different color systems, so they keep the codes
+    of each color system instead.
+    """
+
+    __slots__ = ["_codes"]
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._codes: Dict[ColorSystem, str] = {}
+
+    @classmethod
+    def share(cls, style: Style) -> "SharedStyle":
+        """Get a shared copy of a style."""
+        if isinstance(style, SharedStyle):
+            return style
+        shared: SharedStyle = cls.__new__(cls)
+        for name in Style.__slots__:
+            setattr(shared, name, getattr(style, name))
+        shared._ansi = None
+        shared._codes = {}
+        return shared
+
+    def _make_ansi_codes(self, color_system: ColorSystem) -> str:
+        codes = self._codes.get(color_system)
+        if codes is None:
+            codes = self._codes[color_system] = super()._make_ansi_codes(color_system)
+            # Keep the instance cache empty, so each render looks up its color system
+            self._ansi = None
+        return codes
+
+
+class StyleSet(NamedTuple):
+    """Styles of a renderable for one color and background color.
+
+    Args:
+        normal (Style): Color on background color.
+        inverted (Style): Normal style inverted with the inversion strategy of the renderable.
+        swapped (Style): Normal style with swapped colors, used to replace blocks with background.
+        background (Style): Background color only.
+    """
+
+    normal: Style
+    inverted: Style
+    swapped: Style
+    background: Style
+
+
+class StyleCacheInfo(NamedTuple):
+    """Statistics of a style cache."""
+
+    hits: int
+    misses: int
+    size: int
+
+
+class StyleCache:
+    """Interns styles, so identical styles are created once and shared between renderables.
+
+    Styles are ``SharedStyle`` instances, so they render correctly to
+    consoles with different color systems.
+
+    Args:
+        maxsize (int, optional): Number of styles after which the cache is cleared. Defaults to 4096.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self._maxsize = maxsize
+        self._styles: Dict[Tuple, Style] = {}
+        self._sets: Dict[Tuple, StyleSet] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def _lookup(self, cache: Dict, key: Tuple):
+        result = cache.get(key)
+        if result is None:
+            self._misses += 1
+            if len(cache) >= self._maxsize:
+                cache.clear()
+        else:
+            self._hits += 1
+        return result
+
+    def get(
+        self,
+        color: Optional[ColorType] = None,
+        bgcolor: Optional[ColorType] = None,
+    ) -> Style:
+        """Get style for color and background color."""
+        key = (color, bgcolor)
+        style = self._lookup(self._styles, key)
+        if style is None:
+            style = self._styles[key] = SharedStyle(color=color, bgcolor=bgcolor)
+        return style
+
+    def invert(
+        self, style: Style, strategy: Optional[InversionStrategy] = "swap"
+    ) -> Style:
+        """Get inverted style, see ``invert_style``."""
+        key = (style, strategy)
+        inverted = self._lookup(self._styles, key)
+        if inverted is None:
+            inverted = invert_style(style, strategy)
+            inverted = self._styles[key] = SharedStyle.share(inverted)
+        return inverted
+
+    def styles(
+        self,
+        color: Optional[ColorType] = None,
+        bgcolor: Optional[ColorType] = None,
+        strategy: Optional[InversionStrategy] = None,
+    ) -> StyleSet:
+        """Get all styles of a renderable for color and background color.
+
+        Args:
+            color (Union[Color, str], optional): Color of the renderable.
+            bgcolor (Union[Color, str], optional): Background color.
+            strategy (Literal["reverse",  "swap"], optional): Inversion strategy.
+
+        Returns:
+            StyleSet: Normal, inverted, swapped and background style.
+        """
+        key = (color, bgcolor, strategy)
+        styles = self._lookup(self._sets, key)
+        if styles is None:
+            normal = self.get(color, bgcolor)
+            styles = self._sets[key] = StyleSet(
+                normal=normal,
+                inverted=self.invert(normal, strategy),
+                swapped=self.invert(normal),
+                background=self.get(None, bgcolor),
+            )
+        return styles
+
+    def info(self) -> StyleCacheInfo:
+        """Get hit and miss statistics of the cache."""
+        return StyleCacheInfo(
+            self._hits, self._misses, len(self._styles) + len(self._sets)
+        )
+
+    def clear(self) -> None:
+        """Clear cached styles and statistics."""
+        self._styles.clear()
+        self._sets.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+STYLES = StyleCache()
+"""Style cache shared by all renderables."""
@@ -0,0 +1,287 @@
+from typing import List, Optional, Tuple
+
+from rich.console import Console, ConsoleOptions, RenderResult, RenderableType
+from rich.measure import Measurement
+from rich.segment import Segment
+
+from graphical._measure import render_scope
+from graphical._segment import simplify
+from graphical.group import Horizontal, Vertical, _columns, _rows, _size
+
+Lines = List[List[Segment]]
+
+
+def _crop(line: List[Segment], x: int, width: int) -> List[Segment]:
+    if x == 0 and Segment.get_line_length(line) <= width:
+        return line
+    parts = list(Segment.divide(line, [x, x + width]))
+    return parts[1] if len(parts) > 1 else []
+
+
+def _render(
+    renderable: RenderableType, console: Console, options: ConsoleOptions
+) -> Tuple[Lines, int]:
+    """Render a renderable without a fixed size.
+
+    Returns:
+        Tuple[Lines, int]: Lines without padding, and rows the renderable takes in a ``Vertical``.
+    """
+    segments = list(console.render(renderable, options))
+    # Children of ``Vertical`` are not cropped
+    lines = Segment.split_lines(segments)
+    # Vertical adds a new line after each child, one row more than new lines
+    rows = sum(text.count("\n") for text, _, _ in segments) + 1
+    return list(lines), rows
+
+
+def _extent(
+    renderable: RenderableType, console: Console, options: ConsoleOptions
+) -> Tuple[int, int, bool]:
+    """Get the lines of a renderable, and the rows it takes in a ``Vertical``.
+
+    Children of groups are sized separately, so only children without a
+    fixed size are rendered.
+
+    Returns:
+        Tuple[int, int, bool]: Number of lines, number of rows in a ``Vertical``, and if the last line is empty.
+    """
+    if isinstance(renderable, Vertical):
+        extents = [_extent(d, console, options) for d in renderable._renderables]
+        gaps = renderable._gap * max(len(extents) - 1, 0)
+        height = sum(rows for _, rows, _ in extents) + gaps
+        # The last line is empty if the last child ends with a new line
+        blank = bool(extents) and extents[-1][1] > extents[-1][0]
+        return height, height + 1, blank
+    if isinstance(renderable, Horizontal):
+        options = console.options
+        extents = [_extent(d, console, options) for d in renderable._renderables]
+        rows = max((height for height, _, _ in extents), default=0)
+        height = rows
+        blank = False
+        if rows and not (renderable._gap > 0 and len(extents) > 1):
+            blank = all(blank for h, _, blank in extents if h == rows)
+        if blank:
+            # Lines are split at new lines, the last row is not a line if empty
+            height -= 1
+            last = _window_horizontal(
+                renderable, console, options, 0, height - 1, options.max_width, 1
+            )
+            blank = height > 0 and not last[0]
+        return height, max(rows, 1), blank
+    size = _size(renderable, console, options)
+    if size is not None:
+        _, height = size
+        return height, _rows(renderable, height), False
+    lines, rows = _render(renderable, console, options)
+    return len(lines), rows, bool(lines) and not lines[-1]
+
+
+def _window(
+    renderable: RenderableType,
+    console: Console,
+    options: ConsoleOptions,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+) -> Lines:
+    """Render the lines of a renderable within a window, without padding."""
+    if width <= 0 or height <= 0:
+        return []
+    if isinstance(renderable, Vertical):
+        return _window_vertical(renderable, console, options, x, y, width, height)
+    if isinstance(renderable, Horizontal):
+        return _window_horizontal(renderable, console, options, x, y, width, height)
+    columns = _columns(renderable, console, options)
+    if columns is not None:
+        rows = [list(row) for row in zip(*columns[x : x + width])][y : y + height]
+        return [list(simplify(row)) for row in rows]
+    lines, _ = _render(renderable, console, options)
+    return [_crop(line, x, width) for line in lines[y : y + height]]
+
+
+def _window_vertical(
+    group: Vertical,
+    console: Console,
+    options: ConsoleOptions,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+) -> Lines:
+    result: Lines = []
+    top = 0
+    for idx, renderable in enumerate(group._renderables):
+        if top >= y + height:
+            break
+        if idx > 0:
+            gap_rows = min(top + group._gap, y + height) - max(top, y)
+            result += [[] for _ in range(max(gap_rows, 0))]
+            top += group._gap
+        lines = None
+        if _size(renderable, console, options) is None and not isinstance(
+            renderable, (Vertical, Horizontal)
+        ):
+            lines, rows = _render(renderable, console, options)
+        else:
+            # Groups without a fixed size are rendered only within the window
+            rows = _extent(renderable, console, options)[1]
+        if top + rows > y:
+            start = max(y - top, 0)
+            count = min(top + rows, y + height) - (top + start)
+            if lines is None:
+                lines = _window(renderable, console, options, x, start, width, count)
+            else:
+                lines = [_crop(line, x, width) for line in lines[start : start + count]]
+            # Rows after the lines of a child are empty
+            result += lines + [[] for _ in range(count - len(lines))]
+        top += rows
+    return result
+
+
+def _window_horizontal(
+    group: Horizontal,
+    console: Console,
+    options: ConsoleOptions,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+) -> Lines:
+    # Children of the group are rendered with the options of the console
+    options = console.options
+    children = []
+    for renderable in group._renderables:
+        size = _size(renderable, console, options)
+        lines = None
+        if isinstance(renderable, (Vertical, Horizontal)):
+            size = None, _extent(renderable, console, options)[0]
+        elif size is None:
+            lines = console.render_lines(renderable, options, pad=False)
+            size = None, len(lines)
+        children.append((renderable, size, lines))
+    rows = min(max((h for _, (_, h), _ in children), default=0) - y, height)
+    if rows <= 0:
+        return []
+    # Like the group, the lines of children are not padded, so cells after a
+    # shorter line of a child, or after the last line of a child, move left.
+    # Cells of each row left of the window are only counted.
+    result: Lines = [[] for _ in range(rows)]
+    offsets = [0] * rows
+    skipped: List[Optional[int]] = [None] * rows
+
+    def write(row: int, line: List[Segment], length: int) -> None:
+        if skipped[row] is None and offsets[row] + length <= x and offsets[row] < x:
+            offsets[row] += length
+            return
+        if skipped[row] is None:
+            skipped[row] = offsets[row]
+        if offsets[row] < x + width:
+            result[row] += line
+        offsets[row] += length
+
+    gap = [Segment(" " * group._gap)]
+    for idx, (renderable, (child_width, child_height), lines) in enumerate(children):
+        if min(offsets) >= x + width:
+            break
+        if idx > 0 and group._gap > 0:
+            for row in range(rows):
+                write(row, gap, group._gap)
+        count = min(child_height - y, rows)
+        if count <= 0:
+            continue
+        if lines is not None:
+            lines = lines[y : y + count]
+        elif child_width is None:
+            # Lines of groups are cropped to the maximum width, like other lines
+            lines = _window(
+                renderable, console, options, 0, y, options.max_width, count
+            )
+        elif child_width > options.max_width or any(
+            skipped[row] is not None or offsets[row] + child_width > x
+            for row in range(count)
+        ):
+            columns = _columns(renderable, console, options)
+            if columns is None:
+                lines = console.render_lines(renderable, options, pad=False)
+                lines = lines[y : y + count]
+            else:
+                lines = [list(simplify(row)) for row in zip(*columns)][y : y + count]
+        else:
+            # Child is left of the window in all of its rows
+            for row in range(count):
+                offsets[row] += child_width
+            continue
+        for row, line in enumerate(lines):
+            write(row, line, Segment.get_line_length(line))
+    return [
+        list(simplify(_crop(line, x - (start or 0), width)))
+        for line, start in zip(result, skipped)
+    ]
+
+
+class Viewport:
+    """Renders a window of a renderable.
+
+    Children of ``Vertical`` and ``Horizontal`` groups, that are outside of
+    the window, are skipped without being rendered, if their size in cells is
+    fixed. Other children outside of the window are rendered only to get
+    their size, children of nested groups are sized one by one. Children that
+    are partially visible are clipped. The cost of rendering depends on the
+    size of the window rather than on the size of the groups. The window is
+    the same as the cells of the full render, ``Vertical`` adds a new line
+    after each child and ``Horizontal`` does not pad lines of its children.
+
+    Args:
+        renderable (RenderableType): The renderable, usually a large group.
+        x (int, optional): Column of the top left cell of the window. Defaults to 0.
+        y (int, optional): Row of the top left cell of the window. Defaults to 0.
+        width (int, optional): Width of the window. Defaults to the maximum width.
+        height (int, optional): Height of the window. Defaults to the height of the options or console.
+    """
+
+    def __init__(
+        self,
+        renderable: RenderableType,
+        *,
+        x: int = 0,
+        y: int = 0,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> None:
+        self.renderable = renderable
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    def lines(self, console: Console, options: ConsoleOptions) -> Lines:
+        """Render the lines of the window, without padding.
+
+        Returns:
+            List[List[Segment]]: Lines of the window.
+        """
+        width = options.max_width if self.width is None else self.width
+        height = self.height
+        if height is None:
+            height = options.height or console.height
+        with render_scope():
+            return _window(
+                self.renderable, console, options, self.x, self.y, width, height
+            )
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        new_line = Segment.line()
+        for row_idx, line in enumerate(self.lines(console, options)):
+            if row_idx > 0:
+                yield new_line
+            yield from line
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        if self.width is not None:
+            return Measurement(self.width, self.width)
+        return Measurement.get(console, options, self.renderable)
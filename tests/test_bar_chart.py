@@ -0,0 +1,79 @@
+import pytest
+from rich.console import Console, RenderableType
+from rich.segment import Segment
+
+from graphical.bar import Bar, BarChart
+from graphical.group import Horizontal, Vertical
+from graphical.mark.horizontal import BAR_HEAVY_H
+from graphical.mark.vertical import BAR_BLOCK_V
+
+VALUES = [-4.2, -1.0, 0.0, 0.3, 2.5, 2.5, 7.9, 10.0]
+
+
+def render_lines(renderable: RenderableType):
+    lines = Console(width=80).render_lines(renderable, pad=False)
+    return [list(Segment.simplify(line)) for line in lines]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"prefer_bg": "never"},
+        {"prefer_bg": "all"},
+        {"color": "red", "bgcolor": "blue", "invert_negative": "swap"},
+        {"color": "red", "invert_negative": "reverse"},
+        {"origin": 1.5, "force_origin": False},
+        {"width": 2},
+    ],
+    ids=[
+        "default",
+        "prefer_bg-never",
+        "prefer_bg-all",
+        "swap",
+        "reverse",
+        "origin",
+        "width",
+    ],
+)
+@pytest.mark.parametrize("gap", [0, 1])
+def test_vertical_matches_group(options: dict, gap: int):
+    chart = BarChart(
+        VALUES,
+        (-5, 10),
+        length=10,
+        marks=BAR_BLOCK_V,
+        orientation="vertical",
+        gap=gap,
+        **options,
+    )
+    group = Horizontal(
+        *(
+            Bar(v, (-5, 10), length=10, orientation="vertical", **options)
+            for v in VALUES
+        ),
+        gap=gap,
+    )
+    assert render_lines(chart) == render_lines(group)
+
+
+@pytest.mark.parametrize("gap", [0, 1])
+def test_horizontal_matches_group(gap: int):
+    chart = BarChart(VALUES, (-5, 10), length=20, marks=BAR_HEAVY_H, gap=gap)
+    group = Vertical(
+        *(Bar(v, (-5, 10), length=20, marks=BAR_HEAVY_H) for v in VALUES),
+        gap=gap,
+    )
+    assert render_lines(chart) == render_lines(group)
+
+
+def test_cycled_colors():
+    colors = ["red", "green", "blue"]
+    chart = BarChart(VALUES, (-5, 10), orientation="vertical", color=colors)
+    group = Horizontal(
+        *(
+            Bar(v, (-5, 10), orientation="vertical", color=colors[i % 3])
+            for i, v in enumerate(VALUES)
+        )
+    )
+    assert render_lines(chart) == render_lines(group)
@@ -1,10 +1,15 @@
-from typing import Optional
+from typing import Optional, Tuple
 
 import pytest
 
 from graphical.bar import Bar
 from graphical.mark import Mark
-from graphical.mark.horizontal import BAR_BLOCK_H, BAR_HEAVY_H, BAR_LIGHT_H
+from graphical.mark.horizontal import (
+    BAR_BLOCK_H,
+    BAR_HEAVY_H,
+    BAR_LIGHT_H,
+    LOLLIPOP_FILLED_LIGHT_H,
+)
 from graphical.mark.chromatic import BAR_SHADE
 from graphical.options import InversionStrategy
 from tests.utilities.asserts import assert_markup
@@ -111,6 +116,25 @@ def test_origin(origin: float, force_origin: bool, positive: str, negative: str)
     assert_markup(chart, negative)
 
 
+@pytest.mark.parametrize(
+    "value_range, expected",
+    [
+        ((-10, 7.7), "      ───●"),
+        ((-3.3, 9.9), "   ──────●"),
+        ((-10, 1.1), "         ●"),
+        ((2.2, 9.9), "─────────●"),
+    ],
+)
+def test_cap_at_maximum(value_range: Tuple[float, float], expected: str):
+    chart = Bar(
+        data=value_range[1],
+        value_range=value_range,
+        length=10,
+        marks=LOLLIPOP_FILLED_LIGHT_H,
+    )
+    assert_markup(chart, expected)
+
+
 @pytest.mark.parametrize(
     "color,bgcolor,expected",
     [
@@ -214,3 +238,8 @@ def test_style_inversion(
     )
 
     assert_markup(chart, expected)
+
+
+def test_cap_sign_of_zero():
+    mark = Mark(" ─", caps=("▶", "◀"))
+    assert [mark.cap(v) for v in (0.5, 0.0, -0.0, -0.5)] == ["▶", "▶", "◀", "◀"]
@@ -0,0 +1,95 @@
+import statistics
+
+import pytest
+
+from graphical.data import bins, lttb, m4, minmax
+
+KERNELS = {
+    "mean": statistics.mean,
+    "sum": sum,
+    "min": min,
+    "max": max,
+    "count": len,
+    "first": lambda d: d[0],
+    "last": lambda d: d[-1],
+    "median": statistics.median,
+}
+
+
+@pytest.mark.parametrize("kernel", list(KERNELS))
+@pytest.mark.parametrize("size, num_bins", [(100, 7), (10, 10), (5, 12)])
+@pytest.mark.parametrize("array", [False, True], ids=["list", "numpy"])
+def test_kernels(kernel: str, size: int, num_bins: int, array: bool):
+    data = [((i * 37) % 11) - 3.5 for i in range(size)]
+    expected = list(bins(data, num_bins, summary_function=KERNELS[kernel]))
+    if array:
+        numpy = pytest.importorskip("numpy")
+        data = numpy.array(data)
+    result = list(bins(data, num_bins, summary_function=kernel))
+    assert result == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("kernel", list(KERNELS))
+@pytest.mark.parametrize("size, num_bins", [(15, 11), (30, 11), (158, 75)])
+def test_kernels_rounded_edges(kernel: str, size: int, num_bins: int):
+    # Last bin ends before the last value due to rounding
+    numpy = pytest.importorskip("numpy")
+    data = [float(i) for i in range(size)]
+    expected = list(bins(data, num_bins, summary_function=kernel))
+    result = list(bins(numpy.array(data), num_bins, summary_function=kernel))
+    assert result == pytest.approx(expected)
+    if kernel == "max":
+        assert list(minmax(numpy.array(data), num_bins))[-1][1] == expected[-1]
+        assert list(m4(numpy.array(data), num_bins))[-1][2] == expected[-1]
+
+
+@pytest.mark.parametrize("array", [False, True], ids=["list", "numpy"])
+def test_empty_bins(array: bool):
+    data = [1.0, 2.0]
+    if array:
+        numpy = pytest.importorskip("numpy")
+        data = numpy.array(data)
+    result = list(bins(data, 4, summary_function="mean", spread=False))
+    assert result[1] == 1.0 and result[3] == 2.0
+    assert result[0] != result[0] and result[2] != result[2]
+    assert list(bins(data, 4, summary_function="count", spread=False)) == [0, 1, 0, 1]
+
+
+def test_unknown_kernel():
+    with pytest.raises(ValueError):
+        list(bins([1.0], 1, summary_function="mode"))
+
+
+@pytest.mark.parametrize("array", [False, True], ids=["list", "numpy"])
+def test_lttb(array: bool):
+    data = [float(i % 7) for i in range(1000)]
+    data[500] = 100.0
+    if array:
+        numpy = pytest.importorskip("numpy")
+        data = numpy.array(data)
+    result = list(lttb(data, 50))
+    assert len(result) == 50
+    assert result[0] == data[0] and result[-1] == data[-1]
+    assert 100.0 in result
+
+
+def test_lttb_stream():
+    data = [float((i * 13) % 17) for i in range(1000)]
+    expected = list(lttb(data, 40))
+    assert list(lttb(iter(data), 40)) == expected
+    assert list(lttb(iter(data), 40, length=1000)) == expected
+    numpy = pytest.importorskip("numpy")
+    assert list(lttb(numpy.array(data), 40)) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("size, num_bins", [(100, 7), (5, 12)])
+def test_minmax_m4(size: int, num_bins: int):
+    data = [((i * 37) % 11) - 3.5 for i in range(size)]
+    mins = list(bins(data, num_bins, summary_function=min))
+    maxs = list(bins(data, num_bins, summary_function=max))
+    firsts = list(bins(data, num_bins, summary_function=lambda d: d[0]))
+    lasts = list(bins(data, num_bins, summary_function=lambda d: d[-1]))
+    assert list(minmax(iter(data), num_bins)) == list(zip(mins, maxs))
+    assert list(m4(iter(data), num_bins)) == list(zip(firsts, mins, maxs, lasts))
+    numpy = pytest.importorskip("numpy")
+    assert list(minmax(numpy.array(data), num_bins)) == list(zip(mins, maxs))
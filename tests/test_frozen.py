@@ -0,0 +1,44 @@
+import pytest
+
+from graphical.bar import Bar, Stack
+from graphical.frozen import RENDERS, FrozenBar, FrozenHeat, FrozenStack
+from graphical.group import Horizontal, Vertical
+from graphical.mark import Mark
+from graphical.mark.horizontal import BAR_BLOCK_H
+from graphical.scale.chromatic.sequential import VIRIDIS
+from tests.utilities.render import render_ansi
+
+
+def test_frozen_equal_by_content():
+    bar = FrozenBar(5, (0, 10), length=10, color="red")
+    assert bar == FrozenBar(5, value_range=[0, 10], color="red", length=10)
+    assert hash(bar) == hash(FrozenBar(5, (0, 10), length=10, color="red"))
+    assert bar != FrozenBar(6, (0, 10), length=10, color="red")
+    assert FrozenStack([1, 2], (0, 5)) == FrozenStack((1, 2), (0, 5))
+    assert FrozenHeat(0.5, (0, 1), VIRIDIS) in {FrozenHeat(0.5, (0, 1), VIRIDIS)}
+    assert Mark(" ▌█", caps="▐") == Mark(" ▌█", " ▌█", ("▐", "▐"))
+    assert Mark(" ▌█") != BAR_BLOCK_H
+
+
+def test_frozen_replace():
+    bar = FrozenBar(5, (0, 10), length=10)
+    with pytest.raises(AttributeError):
+        bar.value = 6
+    changed = bar.replace(data=6)
+    assert (bar.value, changed.value) == (5, 6)
+    assert changed == FrozenBar(6, (0, 10), length=10)
+
+
+def test_frozen_renders_once():
+    RENDERS.clear()
+    rows = [
+        Horizontal(FrozenBar(d, (0, 4), length=4), FrozenStack([1, d], (0, 8)))
+        for d in [1, 2, 1, 2]
+    ]
+    expected = [
+        Horizontal(Bar(d, (0, 4), length=4), Stack([1, d], (0, 8)))
+        for d in [1, 2, 1, 2]
+    ]
+    assert render_ansi(Vertical(*rows)) == render_ansi(Vertical(*expected))
+    hits, misses, size = RENDERS.info()
+    assert (hits, misses, size) == (4, 4, 4)
@@ -0,0 +1,112 @@
+import io
+
+from rich.align import Align
+from rich.console import Console
+from rich.measure import Measurement
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+
+from graphical.bar import Bar
+from graphical.group import Horizontal, Vertical, VerticalStream
+from graphical.heat import Heat
+from graphical.scale.chromatic.sequential import VIRIDIS
+from tests.utilities.asserts import assert_markup
+
+
+def test_horizontal_columns_and_lines():
+    chart = Horizontal(
+        Text("ab\nc"),
+        Bar(1.5, (0, 3), length=3, orientation="vertical", color="red"),
+        Bar(3.0, (0, 3), length=3, orientation="vertical", color="red", width=2),
+        gap=1,
+    )
+    assert_markup(
+        chart,
+        "ab   [red on red]  [/red on red]\n"
+        "c [red]▄[/red] [red on red]  [/red on red]\n"
+        " [red on red] [/red on red] [red on red]  [/red on red]",
+    )
+
+
+def test_horizontal_fixed_size_cells():
+    chart = Horizontal(
+        Heat(0, (0, 1), VIRIDIS, repeat_y=2),
+        Bar(1.5, (0, 3), length=3, width=2, color="red"),
+        Heat((0, 1), (0, 1), VIRIDIS, repeat_x=2),
+    )
+    assert_markup(
+        chart,
+        "[on #430154] [/on #430154][red on red] [/red on red][red]▌[/red] "
+        "[#430154 on #fde725]▌▌[/#430154 on #fde725]\n"
+        "[on #430154] [/on #430154][red on red] [/red on red][red]▌[/red] ",
+    )
+
+
+def test_horizontal_crops_children_wider_than_options():
+    chart = Horizontal(Bar(8, (0, 10), length=30, color="red"), Text("abc"), gap=1)
+    assert_markup(
+        Panel(chart, width=20),
+        "╭──────────────────╮\n"
+        "│ [red on red]                [/red on red] │\n"
+        "╰──────────────────╯\n",
+    )
+
+
+class _Counted:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.measured = 0
+        self.widths = []
+
+    def __rich_console__(self, console, options):
+        yield self.text
+
+    def __rich_measure__(self, console, options):
+        self.measured += 1
+        self.widths.append(options.max_width)
+        return Measurement(len(self.text), len(self.text))
+
+
+def test_measurement_cached_per_render():
+    counted = _Counted("abc")
+    row = Horizontal(counted)
+    chart = Vertical(Align.right(row), Align.center(row))
+    assert_markup(chart, "abc\n\nabc\n\n", width=3)
+    assert counted.measured == 1
+    row.append(_Counted("d"))
+    assert Measurement.get(Console(), Console().options, row) == Measurement(4, 4)
+    assert counted.measured == 2
+
+
+def test_measurement_cached_across_table_passes():
+    # Tables measure their cells, then render them, in separate passes
+    cells = [_Counted("x") for _ in range(6)]
+    calendar = Vertical(Horizontal(*cells[:3]), Horizontal(*cells[3:]))
+    inner = Table()
+    inner.add_row(calendar)
+    outer = Table()
+    outer.add_row(inner)
+    console = Console(file=io.StringIO(), width=40)
+    console.print(outer)
+    # Measured once per maximum width, the outer and the inner table width
+    assert [len(cell.widths) for cell in cells] == [2] * 6
+    assert all(len(set(cell.widths)) == 2 for cell in cells)
+    console.print(outer)
+    assert [len(cell.widths) for cell in cells] == [4] * 6
+
+
+def test_vertical_stream():
+    def row(idx: int):
+        return Bar(idx, (0, 2), length=2, color="red") if idx < 3 else None
+
+    chart = VerticalStream(row, gap=1)
+    assert_markup(
+        chart, "  \n\n[red on red] [/red on red] \n\n[red on red]  [/red on red]\n"
+    )
+
+    file = io.StringIO()
+    VerticalStream(iter([Text("a"), Text("b"), Text("c")]), window=2).print(
+        Console(file=file)
+    )
+    assert file.getvalue() == "a\nb\nc\n"
@@ -0,0 +1,46 @@
+from typing import Optional
+
+import pytest
+
+from graphical.heat import HeatMap
+from graphical.options import Orientation
+from graphical.scale.chromatic import SequentialScheme
+from tests.utilities.asserts import assert_markup
+
+SCHEME = SequentialScheme("#ff0000", "#0000ff", resolution=2)
+DATA = [
+    [0.0, 1.0, None],
+    [1.0, None, None],
+    [0.0],
+]
+
+
+@pytest.mark.parametrize(
+    "orientation, expected",
+    [
+        (
+            None,
+            "[on #ff0000] [/][on #0000ff] [/] \n[on #0000ff] [/]  \n[on #ff0000] [/]",
+        ),
+        (
+            "vertical",
+            "[#0000ff on #ff0000]▄[/][#0000ff]▀[/] \n[#ff0000]▀[/]",
+        ),
+        (
+            "horizontal",
+            "[#ff0000 on #0000ff]▌[/] \n[#0000ff]▌[/] \n[#ff0000]▌[/]",
+        ),
+    ],
+    ids=["single", "vertical", "horizontal"],
+)
+def test_packing(orientation: Optional[Orientation], expected: str):
+    chart = HeatMap(DATA, (0, 1), SCHEME, orientation=orientation)
+    assert_markup(chart, expected)
+
+
+def test_repeat():
+    chart = HeatMap([[0.0, 1.0]], (0, 1), SCHEME, repeat_x=2, repeat_y=2)
+    assert_markup(
+        chart,
+        "[on #ff0000]  [/][on #0000ff]  [/]\n[on #ff0000]  [/][on #0000ff]  [/]",
+    )
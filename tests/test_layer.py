@@ -0,0 +1,98 @@
+from io import StringIO
+
+from rich.console import Console
+from rich.segment import Segment
+from rich.text import Text
+
+from graphical.bar import Bar
+from graphical.group import Vertical
+from graphical.layer import Layers
+from tests.utilities.asserts import assert_markup
+
+
+def test_layers_blend_text_over_bar():
+    chart = Layers(
+        Bar(2, (0, 4), length=4, color="red", bgcolor="blue"),
+        Text("a b"),
+    )
+    assert_markup(
+        chart,
+        "[default on red]a[/default on red][blue on red] [/blue on red]"
+        "[default on blue]b[/default on blue][on blue] [/on blue]\n",
+    )
+
+
+def test_layers_background_replaces_cell():
+    chart = Layers(Text("abc\nde"), Text(" x", style="on red"), Text("\n  f"))
+    assert_markup(
+        chart,
+        "[on red] [/on red][default on red]x[/default on red][default]c[/default]\n"
+        "[default]def[/default]\n",
+    )
+
+
+def test_layers_custom_blend():
+    def blend(a: Segment, b: Segment) -> Segment:
+        return a if b.text == "x" else b
+
+    chart = Layers(Text("abc"), Text("xyx"), blend=blend)
+    assert_markup(chart, "ayc\n")
+
+
+def test_layers_opaque():
+    chart = Layers(Text("abc", style="on red"), opaque=True)
+    chart.append(Text("x y", style="blue"))
+    chart.append(Text("  z", style="green"), opaque=False)
+    assert_markup(
+        chart,
+        "[blue]x[/blue][on red]b[/on red][green]z[/green]\n",
+    )
+
+
+def test_layers_blend_per_color_system():
+    chart = Layers(
+        Bar(6, (0, 10), length=10, color="#ff0000"),
+        Text("label", style="#00ff00"),
+    )
+
+    def output(color_system):
+        console = Console(
+            file=StringIO(), color_system=color_system, force_terminal=True
+        )
+        console.print(chart)
+        return console.file.getvalue()
+
+    standard, truecolor = output("standard"), output("truecolor")
+    assert "38;2;" not in standard
+    assert "38;2;0;255;0" in truecolor
+    assert (output("standard"), output("truecolor")) == (standard, truecolor)
+
+
+def test_layers_opaque_empty_lines():
+    assert_markup(Layers(Text("ab\n\n"), opaque=True), "ab\n\n\n")
+    chart = Layers(Vertical(Text("ab"), Text(""), Text("")), opaque=True)
+    assert_markup(chart, "ab\n" + "\n" * 5)
+
+
+class _Hidden:
+    def __init__(self) -> None:
+        self.rendered = 0
+
+    def __graphical_size__(self, console, options):
+        return 2, 1
+
+    def __rich_console__(self, console, options):
+        self.rendered += 1
+        yield Segment("xy")
+
+
+def test_layers_skip_hidden_layers():
+    hidden = _Hidden()
+    chart = Layers(hidden, Text("abc", style="on red"), opaque=True)
+    assert_markup(chart, "[on red]abc[/on red]\n")
+    assert hidden.rendered == 0
+    chart = Layers(hidden, Text("a c", style="on red"), Text(" b"), opaque=True)
+    assert_markup(chart, "[on red]a[/on red]b[on red]c[/on red]\n")
+    assert hidden.rendered == 0
+    assert_markup(Layers(hidden, Text("a"), opaque=True), "ay\n")
+    assert hidden.rendered == 1
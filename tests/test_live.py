@@ -0,0 +1,32 @@
+from io import StringIO
+
+from rich.console import Console
+from rich.text import Text
+
+from graphical.group import Vertical
+from graphical.live import LiveDiff
+
+LINE = "abcdefghijklmnopqrstuvwxyz"
+
+
+def _frame(*lines: str) -> Vertical:
+    return Vertical(*[Text(line, style="red", end="") for line in lines])
+
+
+def test_live_diff_writes_changed_cells():
+    console = Console(
+        file=StringIO(), width=40, color_system="standard", force_terminal=True
+    )
+    live = LiveDiff(console)
+    assert live.diff(_frame(LINE, LINE)) == (
+        f"\x1b[K\x1b[31m{LINE}\x1b[0m\n\x1b[J\x1b[31m{LINE}\x1b[0m"
+    )
+    # Cursor moves to runs of changed cells, nearby runs are joined
+    changed = LINE.replace("b", "B").replace("e", "E").replace("w", "W")
+    assert live.diff(_frame(LINE.replace("c", "C"), changed)) == (
+        "\x1b[1A\x1b[3G\x1b[31mC\x1b[0m"
+        "\x1b[1B\x1b[2G\x1b[31mBcdE\x1b[0m\x1b[23G\x1b[31mW\x1b[0m"
+    )
+    assert live.diff(_frame(LINE.replace("c", "C"), changed)) == ""
+    # Frames of a different height are redrawn
+    assert live.diff(_frame(LINE)) == f"\x1b[1A\r\x1b[J\x1b[31m{LINE}\x1b[0m"
@@ -0,0 +1,51 @@
+import pytest
+from rich.segment import Segment
+
+from graphical.bar import Bar
+from graphical.group import Horizontal, Vertical
+from graphical.layer import Layers
+from graphical.observe import Observable, Observed, observe
+from tests.utilities.asserts import assert_markup
+
+
+class _Counted(Observable):
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.rendered = 0
+
+    def __rich_console__(self, console, options):
+        self.rendered += 1
+        yield Segment(self.text)
+
+
+def test_observe_renders_changed_children():
+    a, b, c = _Counted("a"), _Counted("b"), _Counted("c")
+    bar = Bar(1, (0, 2), length=2, color="red")
+    chart = observe(Vertical(Horizontal(a, bar), Horizontal(Layers(b)), c))
+    assert_markup(chart, "a[red on red] [/red on red] \n[default]b[/default]\nc\n")
+    assert_markup(chart, "a[red on red] [/red on red] \n[default]b[/default]\nc\n")
+    assert (a.rendered, b.rendered, c.rendered) == (1, 1, 1)
+
+    bar.value = 2
+    b.changed()
+    assert_markup(chart, "a[red on red]  [/red on red]\n[default]b[/default]\nc\n")
+    assert (a.rendered, b.rendered, c.rendered) == (1, 2, 1)
+
+    chart.append(_Counted("d"))
+    assert_markup(chart, "a[red on red]  [/red on red]\n[default]b[/default]\nc\nd\n")
+    assert c.rendered == 1
+    assert chart.version > 0
+
+
+class _Value(Observable):
+    value = Observed()
+
+
+def test_observed_not_set():
+    chart = _Value()
+    assert not hasattr(chart, "value")
+    assert getattr(chart, "value", None) is None
+    with pytest.raises(AttributeError, match="value"):
+        chart.value
+    chart.value = 1
+    assert chart.value == 1
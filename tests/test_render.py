@@ -0,0 +1,108 @@
+from io import StringIO
+
+import pytest
+from rich.console import Console
+from rich.segment import Segment, Segments
+from rich.style import Style
+from rich.text import Text
+
+from graphical.bar import Bar, Stack
+from graphical.group import Horizontal, Vertical
+from graphical.heat import Heat
+from graphical.layer import Layers
+from graphical.offset import Offset
+from graphical import render as render_module
+from graphical.render import optimize, render
+from graphical.scale.chromatic.sequential import VIRIDIS
+
+
+def _print(renderable, width, color_system):
+    console = Console(
+        file=StringIO(),
+        width=width,
+        color_system=color_system,
+        force_terminal=True,
+        legacy_windows=False,
+    )
+    console.print(renderable)
+    return console.file.getvalue()
+
+
+@pytest.mark.parametrize("color_system", ["standard", "256", "truecolor"])
+def test_render_same_as_print(color_system):
+    chart = Vertical(
+        Horizontal(
+            *[Heat(v / 8, (0, 1), VIRIDIS) for v in range(8)],
+            Bar(3.3, (0, 10), length=10, color="#ff8800", bgcolor="grey11"),
+            Text("label", style="bold italic"),
+            gap=1,
+        ),
+        Stack([1.5, -2.25, 3], (-4, 6), length=30, colors=["red", "cyan", "blue"]),
+        Layers(
+            Bar(2.5, (0, 4), length=12, color="red"),
+            Offset(Bar(1.5, (0, 4), length=4, color="green", width=2), x=0, y=1),
+        ),
+        Horizontal(
+            *[
+                Bar(v, (0, 4), length=4, width=2, orientation="vertical")
+                for v in (0.5, 2.75, 4)
+            ]
+        ),
+        gap=1,
+    )
+    for width in (12, 80):
+        assert render(chart, width=width, color_system=color_system) == _print(
+            chart, width, color_system
+        )
+
+
+def test_optimize_swaps_complements():
+    red_on_blue = Style(color="red", bgcolor="blue")
+    blue_on_red = Style(color="blue", bgcolor="red")
+    bold = Style(bold=True, color="blue", bgcolor="red")
+    line = [
+        Segment("▌", red_on_blue),
+        Segment("▐▐", blue_on_red),
+        Segment(" ", Style(color="green", bgcolor="blue")),
+        Segment("█", Style(color="red")),
+        Segment("▐", bold),
+    ]
+    lines, saved = optimize([line], "standard")
+    assert lines == [
+        [
+            Segment("▐▐▐█ ", blue_on_red),
+            Segment("▐", bold),
+        ]
+    ]
+    assert saved == len(render(Segments(line), color_system="standard").encode()) - len(
+        render(Segments(lines[0]), color_system="standard").encode()
+    )
+    assert render(Segments(line), color_system="standard", optimize=True) == render(
+        Segments(lines[0]), color_system="standard"
+    )
+
+
+def test_render_color_systems_in_turn():
+    def chart():
+        # New style instances, so Rich's codes are not reused between color systems
+        style = Style(bold=True, color="#ff8800", bgcolor="#0000ff")
+        return Vertical(
+            Bar(3.3, (0, 10), length=10, color="#ff8800", bgcolor="#223344"),
+            Segments([Segment("label", style)]),
+        )
+
+    expected = {d: _print(chart(), 20, d) for d in ("standard", "truecolor")}
+    shared = chart()
+    _print(shared, 20, "standard")
+    for color_system in ("standard", "truecolor", "standard"):
+        output = render(shared, width=20, color_system=color_system)
+        assert output == expected[color_system]
+
+
+def test_escape_codes_bounded(monkeypatch):
+    monkeypatch.setattr(render_module, "_ESCAPES_MAXSIZE", 4)
+    text = Text()
+    for idx in range(10):
+        text.append("x", style=Style(color=f"#0000{idx:02x}"))
+    assert render(text) == _print(text, 80, "truecolor")
+    assert len(render_module._escapes[render_module.COLOR_SYSTEMS["truecolor"]]) <= 4
@@ -0,0 +1,58 @@
+import pytest
+
+from graphical.bar import Bar, Stack
+from graphical.scale import Interval, LinearScale, LogScale, TimeScale, as_scale
+from tests.utilities.render import render_ansi
+
+
+def test_linear_scale_shared_grid():
+    scale = as_scale((0, 10))
+    assert scale is as_scale([0, 10])
+    assert scale == LinearScale((0, 10))
+    assert scale.grid(4) is scale.grid(4)
+    assert scale.grid(4).boundaries == (0.0, 2.5, 5.0, 7.5, 10.0)
+    assert render_ansi(Bar(3.3, scale, length=7)) == render_ansi(
+        Bar(3.3, (0, 10), length=7)
+    )
+
+
+def test_log_scale():
+    scale = LogScale((1, 10_000))
+    assert scale.grid(4).boundaries == (1, 10.0, 100.0, 1000.0, 10_000)
+    assert scale.grid(4).positions == (0.0, 1.0, 2.0, 3.0, 4.0)
+    for value, position in [(1, 0), (50, 1.69897), (10_000, 4)]:
+        assert render_ansi(Bar(value, scale, length=9, color="red")) == render_ansi(
+            Bar(position, (0, 4), length=9, color="red")
+        )
+    assert render_ansi(Stack([9, 90], scale, length=8, origin=1)) == render_ansi(
+        Stack([1, 1], (0, 4), length=8)
+    )
+    with pytest.raises(ValueError):
+        LogScale((0, 10))
+
+
+@pytest.mark.parametrize("array", [False, True], ids=["list", "numpy"])
+def test_time_scale(array):
+    minute, day = 60 * 10**9, 86_400 * 10**9
+    start = 1_767_225_600 * 10**9  # 2026-01-01
+    scale = TimeScale((start, start + 60 * minute))
+    assert scale.interval(60) == Interval(1, "minute")
+    assert scale.interval(10) == Interval(10, "minute")
+    assert scale.buckets(4)[:2] == [start, start + 15 * minute]
+    events = [start - 1, start, start + 30, start + 14 * minute, start + 59 * minute]
+    values = [9.0, 1.0, 2.0, 3.0, 4.0]
+    if array:
+        numpy = pytest.importorskip("numpy")
+        events, values = numpy.array(events), numpy.array(values)
+    assert scale.bins(events, length=4) == [3, 0, 0, 1]
+    assert scale.bins(events, values, length=4, summary_function="sum") == [6, 0, 0, 4]
+
+    months = TimeScale((start - 20 * day, start + 40 * day))
+    assert months.interval(3) == Interval(1, "month")
+    assert months.buckets(3) == [
+        start - 31 * day,
+        start,
+        start + 31 * day,
+        start + 59 * day,
+    ]
+    assert months.bins(events, length=3) == [1, 4, 0]
@@ -0,0 +1,55 @@
+import pytest
+
+from graphical.scale.chromatic import OrdinalScheme, SequentialScheme
+
+
+@pytest.mark.parametrize("value", [0.0, 0.25, 0.5, 1.0])
+def test_lookup_table_samples(value: float):
+    scheme = SequentialScheme("#000000", "#ff0000", "#ffffff", resolution=5)
+    assert scheme.get(value) == scheme.get(value, exact=True)
+
+
+def test_lookup_table_resolution():
+    scheme = SequentialScheme("#000000", "#ffffff", resolution=2)
+    assert scheme.get(0.4) == scheme.get(0.0, exact=True)
+    scheme.resolution = 256
+    assert scheme.get(0.4) != scheme.get(0.0, exact=True)
+
+
+def test_out_of_domain_is_exact():
+    scheme = SequentialScheme("#000000", "#ffffff", closed=True, resolution=2)
+    assert scheme.get(1.5) == scheme.get(1.5, exact=True)
+
+
+@pytest.mark.parametrize("with_numpy", [True, False], ids=["numpy", "python"])
+def test_map(with_numpy: bool, monkeypatch: pytest.MonkeyPatch):
+    if with_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr("graphical._numpy.numpy", None)
+    scheme = SequentialScheme("#000000", "#ff0000", "#ffffff", resolution=5)
+    values = [0.0, 5.0, None, 10.0, float("nan"), 20.0]
+    indices = scheme.indices(values, value_range=(0, 10))
+    assert [int(d) for d in indices] == [0, 2, -1, 4, -1, 4]
+    expected = [
+        scheme.get(0.0).get_truecolor(),
+        scheme.get(0.5).get_truecolor(),
+        (0, 0, 0),
+        scheme.get(1.0).get_truecolor(),
+        (0, 0, 0),
+        scheme.get(1.0).get_truecolor(),
+    ]
+    rgb = scheme.map(values, value_range=(0, 10))
+    assert [tuple(int(c) for c in d) for d in rgb] == expected
+
+
+@pytest.mark.parametrize("with_numpy", [True, False], ids=["numpy", "python"])
+def test_map_ordinal(with_numpy: bool, monkeypatch: pytest.MonkeyPatch):
+    if with_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr("graphical._numpy.numpy", None)
+    scheme = OrdinalScheme("#ff0000", "#00ff00", "#0000ff")
+    assert [int(d) for d in scheme.indices([0, 1, 2, 5, None])] == [0, 1, 2, 2, -1]
+    rgb = scheme.map([1, 7])
+    assert [tuple(int(c) for c in d) for d in rgb] == [(0, 255, 0), (0, 0, 255)]
@@ -0,0 +1,24 @@
+from graphical.sparkline import Sparkline
+from tests.utilities.asserts import assert_markup
+
+
+def test_append_scrolls():
+    chart = Sparkline([1, 2, 3], (0, 8), width=5, color="red")
+    assert_markup(chart, "  [red]▁▂▃[/red]")
+    chart.extend([4, 5, 8])
+    assert_markup(chart, "[red]▂▃▄▅█[/red]")
+    assert chart.values == [2, 3, 4, 5, 8]
+
+
+def test_resample():
+    chart = Sparkline(
+        range(16),
+        (0, 16),
+        width=4,
+        capacity=16,
+        color="red",
+        summary_function="max",
+    )
+    assert_markup(chart, "[red]▂▄▆█[/red]")
+    chart.append(0)
+    assert_markup(chart, "[red]▂▄▆█[/red]")
@@ -0,0 +1,55 @@
+from io import StringIO
+
+from rich.console import Console
+from rich.style import Style
+
+from graphical.bar import Bar
+from graphical.style import StyleCache, StyleCacheInfo
+
+
+def test_interned_styles():
+    cache = StyleCache()
+    style = cache.get("red", "blue")
+    assert style == Style(color="red", bgcolor="blue")
+    assert cache.get("red", "blue") is style
+    assert cache.info() == StyleCacheInfo(hits=1, misses=1, size=1)
+
+
+def test_style_set():
+    cache = StyleCache()
+    styles = cache.styles("red", "blue", "reverse")
+    assert styles.normal == Style(color="red", bgcolor="blue")
+    assert styles.inverted == Style(color="red", bgcolor="blue", reverse=True)
+    assert styles.swapped == Style(color="blue", bgcolor="red")
+    assert styles.background == Style(bgcolor="blue")
+    assert cache.styles("red", "blue", "reverse") is styles
+
+
+def test_clear_when_full():
+    cache = StyleCache(maxsize=2)
+    for color in ["red", "green", "blue"]:
+        cache.get(color)
+    assert cache.info().size == 1
+
+
+def test_shared_styles_per_color_system():
+    bar = Bar(
+        -3,
+        (-5, 5),
+        length=5,
+        color="#ff0000",
+        bgcolor="#0000ff",
+        invert_negative="swap",
+    )
+
+    def output(color_system):
+        console = Console(
+            file=StringIO(), color_system=color_system, force_terminal=True
+        )
+        console.print(bar)
+        return console.file.getvalue()
+
+    standard, truecolor = output("standard"), output("truecolor")
+    assert "38;2;" not in standard
+    assert "38;2;255;0;0" in truecolor
+    assert (output("standard"), output("truecolor")) == (standard, truecolor)
@@ -0,0 +1,83 @@
+import io
+
+import pytest
+from rich.console import Console
+from rich.segment import Segment
+from rich.text import Text
+
+from graphical.bar import Bar, Stack
+from graphical.group import Horizontal, Vertical
+from graphical.heat import Heat
+from graphical.scale.chromatic.sequential import VIRIDIS
+from graphical.viewport import Viewport, _crop
+from tests.utilities.asserts import assert_markup
+
+
+class _Counted:
+    def __init__(self) -> None:
+        self.rendered = 0
+
+    def __graphical_size__(self, console, options):
+        return 1, 1
+
+    def __rich_console__(self, console, options):
+        self.rendered += 1
+        yield Segment("x")
+
+
+def test_viewport_clips_groups():
+    chart = Vertical(
+        *[
+            Horizontal(*[Bar(v, (0, 4), length=4, color="red") for v in (1, 2, 3)])
+            for _ in range(3)
+        ],
+        gap=1,
+    )
+    assert_markup(
+        Viewport(chart, x=3, y=2, width=6, height=2),
+        " [red on red]  [/red on red]  [red on red] [/red on red]\n",
+    )
+
+
+def test_viewport_clips_gaps():
+    chart = Horizontal(*[Text(c) for c in "abcdef"], gap=1)
+    assert_markup(Viewport(chart, x=3, width=5, height=1), " c d ")
+
+
+def test_viewport_skips_rows_above_window():
+    cells = [_Counted() for _ in range(100)]
+    chart = Vertical(
+        *[Horizontal(Text(f"{idx:02d}"), cell) for idx, cell in enumerate(cells)]
+    )
+    assert_markup(Viewport(chart, y=98, height=2), "98x\n99x")
+    assert [idx for idx, cell in enumerate(cells) if cell.rendered] == [98, 99]
+
+
+def test_viewport_keeps_rows_of_vertical():
+    chart = Vertical(Text("a"), Text("b"), Text("c"))
+    assert_markup(Viewport(chart, height=3), "a\n\nb")
+    assert_markup(Viewport(chart, y=3, height=3), "\nc\n")
+
+
+@pytest.mark.parametrize("x,width", [(0, 30), (2, 5), (6, 20)])
+@pytest.mark.parametrize("y", range(0, 18, 3))
+def test_viewport_crops_full_render(x, y, width):
+    chart = Vertical(
+        Horizontal(Text("ab\nc"), Bar(3, (0, 4), length=2, orientation="vertical")),
+        Horizontal(
+            Text("xyz\n"),
+            Heat(0.5, (0, 1), VIRIDIS, repeat_y=2),
+            Stack((1, 2), (0, 4), length=3),
+            gap=1,
+        ),
+        Vertical(Text("q"), Bar(1, (0, 4), length=6, color="red")),
+        gap=1,
+    )
+    console = Console(file=io.StringIO(), width=30, color_system="truecolor")
+    full = list(Segment.split_lines(console.render(chart)))
+    expected = [_crop(line, x, width) for line in full[y : y + 4]]
+    window = Viewport(chart, x=x, y=y, width=width, height=4)
+    lines = window.lines(console, console.options)
+    assert [list(Segment.simplify(line)) for line in lines] == [
+        list(Segment.simplify(line)) for line in expected
+    ]